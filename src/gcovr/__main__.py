@@ -38,11 +38,13 @@ from .filter import (
     AlwaysMatchFilter,
     DirectoryPrefixFilter,
     Filter,
+    clear_filter_cache,
 )
 from .formats.gcov.read import GcovProgram
 from .formats.gcov.workers import Workers
 from .logging import configure_logging, update_logging, LOGGER
 from .options import FilterOption
+from .utils import clear_checked_cache_dirs, clear_source_caches
 from .version import __version__
 
 # formats
@@ -242,6 +244,9 @@ def main(args: list[str] | None = None) -> int:  # pylint: disable=too-many-retu
 
     # We need to reset the stored information her for our test framework
     GcovProgram.reset()
+    clear_filter_cache()
+    clear_source_caches()
+    clear_checked_cache_dirs()
 
     for postfix in ["", "line", "branch"]:
         key_medium = "medium_threshold"
@@ -922,6 +922,17 @@ GCOVR_CONFIG_OPTIONS = [
         action="store_true",
         const_negate=False,
     ),
+    GcovrConfigOption(
+        "source_analysis_cache_dir",
+        ["--source-analysis-cache-dir"],
+        group="gcov_options",
+        help=(
+            "Store the analysis of the source files used for the exclusions "
+            "(exclusion markers, non-code lines and unreachable branches) in this directory "
+            "and reuse it in later runs if the source file and the options are unchanged."
+        ),
+        type=relative_path,
+    ),
     GcovrConfigOption(
         "exclude_throw_branches",
         ["--exclude-throw-branches"],
@@ -32,6 +32,8 @@ from .coverage_dict import CoverageDict
 from .merging import MergeOptions
 from .stats import CoverageStat, DecisionCoverageStat, SummarizedStats
 
+_NATURAL_SORT_SPLIT_PATTERN = re.compile(r"([0-9]+)")
+
 
 class CoverageContainer:
     """Coverage container holding all the coverage data."""
@@ -99,36 +101,27 @@ class CoverageContainer:
 
     def collapse_directories_with_single_child(self) -> None:
         """Remove directory containers with only one file coverage item."""
-        while True:
-            children = list(self.values())
-            if len(children) == 1 and isinstance(children[0], CoverageContainer):
-                self.dirname = children[0].dirname
-                self.clear()
-                for grandchild_covdata in children[0].values():
-                    if isinstance(grandchild_covdata, FileCoverage):
-                        LOGGER.debug("      Move file %s.", grandchild_covdata.filename)
-                        self[grandchild_covdata.filename] = grandchild_covdata
-                    else:
-                        LOGGER.debug(
-                            "      Move directory %s.", grandchild_covdata.dirname
-                        )
-                        self[grandchild_covdata.dirname] = grandchild_covdata
-                        grandchild_covdata.parent = self
-                continue
-
-            # Nothing changed, so we can stop collapsing directories
-            break
+        while len(self.data) == 1:
+            child = next(iter(self.values()))
+            if not isinstance(child, CoverageContainer):
+                break
+            # Take over the data of the child without copying it, the keys
+            # are the filenames and the normalized directory names.
+            LOGGER.debug("      Collapse directory %s.", child.dirname)
+            self.dirname = child.dirname
+            self.data = child.data
+            for grandchild_covdata in self.values():
+                if isinstance(grandchild_covdata, CoverageContainer):
+                    grandchild_covdata.parent = self
 
         for value in self.values():
             if isinstance(value, CoverageContainer):
                 value.collapse_directories_with_single_child()
 
-    def serialize(self, options: Options) -> list[dict[str, Any]]:
-        """Serialize the object."""
-        data = list[dict[str, Any]]()
+    def serialize(self, options: Options) -> Iterator[dict[str, Any]]:
+        """Serialize the object, the files are serialized one after the other."""
         for value in sorted(self.filecov(recurse=True), key=lambda cov: cov.filename):
-            data.append(value.serialize(options))
-        return data
+            yield value.serialize(options)
 
     @classmethod
     def deserialize(
@@ -233,45 +226,60 @@ class CoverageContainer:
         """
 
         basedir = commonpath([covdata.filename for covdata in covdata_list])
+        realpath_basedir = (
+            os.path.realpath(basedir) if filename_uses_relative_pathname else None
+        )
 
-        def key_filename(covdata: CoverageContainer | FileCoverage) -> list[int | str]:
-            def convert_to_int_if_possible(text: str) -> int | str:
-                return int(text) if text.isdigit() else text
-
-            key = (
-                force_unix_separator(
-                    os.path.relpath(
-                        os.path.realpath(covdata.filename), os.path.realpath(basedir)
+        # The keys are cached in the properties which are cleared before each writer.
+        def key_filename(
+            covdata: CoverageContainer | FileCoverage,
+        ) -> tuple[int | str, ...]:
+            cache: dict[str | None, tuple[int | str, ...]] = (
+                covdata.properties.setdefault("sort_key_filename", {})
+            )
+            if (key := cache.get(realpath_basedir)) is None:
+                if realpath_basedir is None:
+                    text = covdata.filename
+                else:
+                    if (realpath := covdata.properties.get("realpath")) is None:
+                        realpath = covdata.properties["realpath"] = os.path.realpath(
+                            covdata.filename
+                        )
+                    text = force_unix_separator(
+                        os.path.relpath(realpath, realpath_basedir)
                     )
+                key = cache[realpath_basedir] = tuple(
+                    int(part) if part.isdigit() else part
+                    for part in _NATURAL_SORT_SPLIT_PATTERN.split(text.casefold())
                 )
-                if filename_uses_relative_pathname
-                else covdata.filename
-            ).casefold()
 
-            return [
-                convert_to_int_if_possible(part) for part in re.split(r"([0-9]+)", key)
-            ]
+            return key
+
+        def key_uncovered(
+            covdata: CoverageContainer | FileCoverage,
+        ) -> tuple[int, float]:
+            cache_key = f"sort_key_uncovered_{by_metric}"
+            if (key := covdata.properties.get(cache_key)) is None:
+                if by_metric == "branch":
+                    stat = covdata.branch_coverage()
+                elif by_metric == "decision":
+                    stat = covdata.decision_coverage().to_coverage_stat
+                else:
+                    stat = covdata.line_coverage()
+                # No branches are always put directly after (or before when reversed)
+                # files with 100% coverage (by assigning such files 110% coverage)
+                key = covdata.properties[cache_key] = (
+                    stat.total - stat.covered,
+                    stat.covered / stat.total if stat.total > 0 else 1.1,
+                )
 
-        def coverage_stat(covdata: CoverageContainer | FileCoverage) -> CoverageStat:
-            if by_metric == "branch":
-                return covdata.branch_coverage()
-            if by_metric == "decision":
-                return covdata.decision_coverage().to_coverage_stat
-            return covdata.line_coverage()
+            return key
 
         def key_num_uncovered(covdata: CoverageContainer | FileCoverage) -> int:
-            stat = coverage_stat(covdata)
-            uncovered = stat.total - stat.covered
-            return uncovered
+            return key_uncovered(covdata)[0]
 
         def key_percent_uncovered(covdata: CoverageContainer | FileCoverage) -> float:
-            stat = coverage_stat(covdata)
-            covered = stat.covered
-            total = stat.total
-
-            # No branches are always put directly after (or before when reversed)
-            # files with 100% coverage (by assigning such files 110% coverage)
-            return covered / total if total > 0 else 1.1
+            return key_uncovered(covdata)[1]
 
         if sort_key == "uncovered-number":
             # First sort filename alphabetical and then by the requested key
@@ -384,41 +392,39 @@ class CoverageContainer:
         self, filecov: FileCoverage, options: MergeOptions
     ) -> None:
         """Add a file coverage item."""
-        self._stats = None
-        dirname = os.path.dirname(filecov.filename) + os.path.sep
-        if dirname == self.dirname:
-            key = filecov.filename
-            if key in self.data:
-                value = self.data[key]
-                if not isinstance(value, FileCoverage):
-                    raise TypeError(
-                        f"Expected a FileCoverage object for key {key}, but got {type(value)}."
-                    )
-                value.merge(filecov, options)
-            else:
-                self.data[key] = filecov
+        # Normalize the path first, a component like ".." must not create a node.
+        dirname = os.path.normpath(os.path.dirname(filecov.filename)) + os.path.sep
+        if dirname.startswith(self.dirname):
+            relative_dirname = dirname[len(self.dirname) :]
         else:
-            covdata_dirname = (
-                os.path.join(
-                    self.dirname,
-                    os.path.relpath(dirname, self.dirname).split(
-                        os.path.sep, maxsplit=1
-                    )[0],
-                )
-                + os.path.sep
-            )
-            if covdata_dirname in self.data:
-                covdata = self[covdata_dirname]
-            else:
-                covdata = self[covdata_dirname] = CoverageContainer(
-                    covdata_dirname,
-                    self,
-                )
-            if not isinstance(covdata, CoverageContainer):
+            # Only files outside of the root need the expensive relpath.
+            relative_dirname = os.path.relpath(dirname, self.dirname) + os.path.sep
+        # Split the path only once and walk down the tree component by component.
+        covdata: CoverageContainer = self
+        for component in relative_dirname.split(os.path.sep):
+            covdata._stats = None  # pylint: disable=protected-access
+            if component in ("", "."):
+                continue
+            key = covdata.dirname + component + os.path.sep
+            child = covdata.data.get(key)
+            if child is None:
+                child = covdata.data[key] = CoverageContainer(key, covdata)
+            elif not isinstance(child, CoverageContainer):
                 raise TypeError(
-                    f"Expected a CoverageContainer object for key {covdata_dirname}, but got {type(covdata)}."
+                    f"Expected a CoverageContainer object for key {key}, but got {type(child)}."
                 )
-            covdata.insert_file_coverage(filecov, options)
+            covdata = child
+
+        key = filecov.filename
+        value = covdata.data.get(key)
+        if value is None:
+            covdata.data[key] = filecov
+        elif not isinstance(value, FileCoverage):
+            raise TypeError(
+                f"Expected a FileCoverage object for key {key}, but got {type(value)}."
+            )
+        else:
+            value.merge(filecov, options)
 
     @property
     def properties(self) -> dict[str, Any]:
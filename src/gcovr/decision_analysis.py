@@ -19,6 +19,7 @@
 
 # cspell:ignore ault
 
+from dataclasses import dataclass
 import re
 
 from .data_model.coverage import (
@@ -30,6 +31,7 @@ from .data_model.coverage import (
 )
 from .exceptions import SanityCheckError
 from .logging import LOGGER
+from .utils import get_source_cache
 
 _CHARACTERS_TO_ADD_SPACES = re.compile(r"([;:\(\)\{\}])")
 _C_STYLE_COMMENT_PATTERN = re.compile(r"/\*.*?\*/")
@@ -71,15 +73,14 @@ def _prepare_decision_string(code: str) -> str:
     return " " + code.lstrip().strip()
 
 
-def _get_delta_braces(code: str) -> int:
-    prepared_string = _prepare_decision_string(code)
+def _get_delta_braces(prepared_string: str) -> int:
     return prepared_string.count("(") - prepared_string.count(")")
 
 
-def _is_a_branch_statement(code: str) -> bool:
-    r"""Checks, if the given line of code is a branch statement"""
+def _is_a_branch_statement(prepared_string: str) -> bool:
+    r"""Checks, if the given prepared line of code is a branch statement"""
     return any(
-        s in _prepare_decision_string(code)
+        s in prepared_string
         for s in (
             " if (",
             "; if (",
@@ -91,32 +92,31 @@ def _is_a_branch_statement(code: str) -> bool:
     )
 
 
-def _is_a_oneline_branch(code: str) -> bool:
-    r"""Checks, if the given line of code is a branch and branch statement and code block is in one line
+def _is_a_oneline_branch(prepared_string: str) -> bool:
+    r"""Checks, if the given prepared line of code is a branch and branch statement and code block is in one line
 
-    >>> _is_a_oneline_branch('if(a>5){a = 0;}')
+    >>> _is_a_oneline_branch(_prepare_decision_string('if(a>5){a = 0;}'))
     True
-    >>> _is_a_oneline_branch('if(a>5){')
+    >>> _is_a_oneline_branch(_prepare_decision_string('if(a>5){'))
     False
     """
-    return _ONE_LINE_BRANCH.match(_prepare_decision_string(code)) is not None
+    return _ONE_LINE_BRANCH.match(prepared_string) is not None
 
 
-def _is_a_closed_branch(code: str) -> bool:
-    r"""Checks, if the given line of code is a branch which is closed on the same line
+def _is_a_closed_branch(prepared_string: str) -> bool:
+    r"""Checks, if the given prepared line of code is a branch which is closed on the same line
 
-    >>> _is_a_closed_branch('if(a>5){a = 0;}')
+    >>> _is_a_closed_branch(_prepare_decision_string('if(a>5){a = 0;}'))
     False
-    >>> _is_a_closed_branch('if(a>5){ // A comment')
+    >>> _is_a_closed_branch(_prepare_decision_string('if(a>5){ // A comment'))
     True
-    >>> _is_a_closed_branch('   while (a>5){ // A comment')
+    >>> _is_a_closed_branch(_prepare_decision_string('   while (a>5){ // A comment'))
     True
-    >>> _is_a_closed_branch('   while (a>5)')
+    >>> _is_a_closed_branch(_prepare_decision_string('   while (a>5)'))
     True
-    >>> _is_a_closed_branch('   while (a>5')
+    >>> _is_a_closed_branch(_prepare_decision_string('   while (a>5'))
     False
     """
-    prepared_string = _prepare_decision_string(code)
     if (
         _is_a_branch_statement(prepared_string) or _is_a_loop(prepared_string)
     ) and not _is_a_oneline_branch(prepared_string):
@@ -125,28 +125,90 @@ def _is_a_closed_branch(code: str) -> bool:
     return False
 
 
-def _is_a_loop(code: str) -> bool:
-    r"""Checks, if the given line of code is a loop-statement (while,do-while,if)
+def _is_a_loop(prepared_string: str) -> bool:
+    r"""Checks, if the given prepared line of code is a loop-statement (while,do-while,if)
 
-    >>> _is_a_loop('while(5 < a) {')
+    >>> _is_a_loop(_prepare_decision_string('while(5 < a) {'))
     True
     """
-    prepared_string = _prepare_decision_string(code)
     return any(
         s in prepared_string for s in (" while (", "} while (", " for ", " for (")
     )
 
 
-def _is_a_switch(code: str) -> bool:
-    r"""Check if the given line relates to a switch-case label (case,default)
+@dataclass(frozen=True)
+class _LineStructure:
+    """The structure of a source line needed for the decision analysis."""
+
+    is_switch: bool
+    """The line contains a switch-case label (case, default)."""
+    is_branch_statement: bool
+    """The line contains a branch statement (if, case, default)."""
+    is_loop: bool
+    """The line contains a loop statement (while, do-while, for)."""
+    is_oneline_branch: bool
+    """The branch statement and the code block are in the same line."""
+    is_closed_branch: bool
+    """The line contains a branch or a loop which is closed on the same line."""
+    delta_braces: int
+    """The difference between the opening and closing parentheses."""
+    has_break: bool
+    """The line contains a break statement."""
+
+
+_EMPTY_LINE_STRUCTURE = _LineStructure(
+    is_switch=False,
+    is_branch_statement=False,
+    is_loop=False,
+    is_oneline_branch=False,
+    is_closed_branch=False,
+    delta_braces=0,
+    has_break=False,
+)
 
-    >>> _is_a_switch('case /* Comment */ 5 /* Comment */:')
+
+def _get_line_structure(code: str) -> _LineStructure:
+    r"""Get the structure of a line, the line is only prepared once for all checks.
+
+    >>> _get_line_structure('   if (a > 5) { // check for something ')
+    _LineStructure(is_switch=False, is_branch_statement=True, is_loop=False, is_oneline_branch=False, is_closed_branch=True, delta_braces=0, has_break=False)
+    >>> _get_line_structure('case 5: a++; break;')
+    _LineStructure(is_switch=True, is_branch_statement=True, is_loop=False, is_oneline_branch=False, is_closed_branch=True, delta_braces=0, has_break=True)
+    >>> _get_line_structure('   while (a>5')
+    _LineStructure(is_switch=False, is_branch_statement=False, is_loop=True, is_oneline_branch=False, is_closed_branch=False, delta_braces=1, has_break=False)
+    >>> _get_line_structure('default /* Comment */ :').is_switch
     True
-    >>> _is_a_switch('default /* Comment */ :')
+    >>> _get_line_structure('  a++; // Comment') is _EMPTY_LINE_STRUCTURE
     True
     """
     prepared_string = _prepare_decision_string(code)
-    return any(s in prepared_string for s in (" case ", " default :"))
+    line_structure = _LineStructure(
+        is_switch=any(s in prepared_string for s in (" case ", " default :")),
+        is_branch_statement=_is_a_branch_statement(prepared_string),
+        is_loop=_is_a_loop(prepared_string),
+        is_oneline_branch=_is_a_oneline_branch(prepared_string),
+        is_closed_branch=_is_a_closed_branch(prepared_string),
+        delta_braces=_get_delta_braces(prepared_string),
+        has_break=" break ;" in prepared_string,
+    )
+
+    return (
+        _EMPTY_LINE_STRUCTURE
+        if line_structure == _EMPTY_LINE_STRUCTURE
+        else line_structure
+    )
+
+
+def _get_source_structure(lines: list[str]) -> list[_LineStructure]:
+    """Get the structure of all lines from the cache of the source file.
+
+    The structure only depends on the source code, therefore it's analyzed only once
+    for each source file and reused for each coverage data of the file, e.g. a header
+    included in several translation units.
+    """
+    return get_source_cache(lines).get(
+        "decision_structure", lambda: [_get_line_structure(code) for code in lines]
+    )
 
 
 class DecisionParser:
@@ -168,6 +230,7 @@ class DecisionParser:
                     linecov_collection.linecov()
                 )[0]
         self.lines = lines
+        self.structure = _get_source_structure(lines)
 
         # status variables for decision analysis
         self.decision_analysis_active: bool = (
@@ -181,36 +244,36 @@ class DecisionParser:
         LOGGER.debug("Starting the decision analysis")
 
         # start to iterate through the lines
-        for lineno, code in enumerate(self.lines, 1):
-            self._parse_one_line(lineno, code)
+        for lineno, line_structure in enumerate(self.structure, 1):
+            self._parse_one_line(lineno, line_structure)
 
         LOGGER.debug("Decision Analysis finished!")
 
-    def _parse_one_line(self, lineno: int, code: str) -> None:
+    def _parse_one_line(self, lineno: int, line_structure: _LineStructure) -> None:
         """Parse a single line"""
         linecov = self.linecov_by_line.get(lineno)
 
-        if linecov is None and not _is_a_switch(code):
+        if linecov is None and not line_structure.is_switch:
             return
 
         # check, if a analysis for a classic if-/else if-branch is active
         if self.decision_analysis_active:
-            self._continue_multiline_decision_analysis(lineno, code)
+            self._continue_multiline_decision_analysis(lineno, line_structure)
 
         # if no decision analysis is active, check the active line of code for a branch_statement or a loop
         if self.decision_analysis_active:
             return
 
-        if not (_is_a_branch_statement(code) or _is_a_loop(code)):
+        if not (line_structure.is_branch_statement or line_structure.is_loop):
             return
 
         # check if a branch exists (prevent misdetection caused by inaccurate parsing)
         if linecov and linecov.has_reportable_branches:
             branchcov_list = list(linecov.branches())
             if (
-                _is_a_loop(code)
-                or _is_a_oneline_branch(code)
-                or (_is_a_closed_branch(code) and (len(branchcov_list) == 2))
+                line_structure.is_loop
+                or line_structure.is_oneline_branch
+                or (line_structure.is_closed_branch and (len(branchcov_list) == 2))
             ):
                 if len(branchcov_list) == 2:
                     # if it's a compact decision, we can only use the fallback to analyze
@@ -230,10 +293,10 @@ class DecisionParser:
                     )
                     LOGGER.debug("Uncheckable decision at line %d", lineno)
             else:
-                self._start_multiline_decision_analysis(lineno, code)
+                self._start_multiline_decision_analysis(lineno, line_structure)
 
         # check if it's a case statement (measured at every line of a case, so a branch definition isn't given)
-        elif _is_a_switch(code):
+        elif line_structure.is_switch:
             # Get the coverage of the next line before a break
             max_lineno = lineno + 1
             if self.linecov_by_line:
@@ -246,19 +309,23 @@ class DecisionParser:
                         linecov, linecov.data_sources, count=linecov.count
                     )
                     break
-                if " break ;" in _prepare_decision_string(code):
+                if line_structure.has_break:
                     break
 
-    def _start_multiline_decision_analysis(self, lineno: int, code: str) -> None:
+    def _start_multiline_decision_analysis(
+        self, lineno: int, line_structure: _LineStructure
+    ) -> None:
         """Handler for start of a decision written over several lines."""
         # normal (non-compact) branch, analyze execution of following lines
         self.decision_analysis_active = True
         self.last_decision_line = lineno
 
         # count brackets to make sure we're outside of the decision expression
-        self.decision_analysis_open_brackets += _get_delta_braces(code)
+        self.decision_analysis_open_brackets += line_structure.delta_braces
 
-    def _continue_multiline_decision_analysis(self, lineno: int, code: str) -> None:
+    def _continue_multiline_decision_analysis(
+        self, lineno: int, line_structure: _LineStructure
+    ) -> None:
         """Handler for a decision which is continued on the current line."""
         linecov = self.linecov_by_line.get(lineno)
         exec_count = 0 if linecov is None else linecov.count
@@ -293,4 +360,4 @@ class DecisionParser:
             self.decision_analysis_open_brackets = 0
         else:
             # count amount of open/closed brackets to track, when we can start checking if the block is executed
-            self.decision_analysis_open_brackets += _get_delta_braces(code)
+            self.decision_analysis_open_brackets += line_structure.delta_braces
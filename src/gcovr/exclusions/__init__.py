@@ -33,6 +33,7 @@ from ..data_model.coverage import FileCoverage
 from ..logging import LOGGER
 from ..options import Options
 
+from .cache import SourceAnalysis, get_source_analysis
 from .markers import ExclusionPredicate, FunctionListByLine, apply_exclusion_markers
 from .noncode import remove_unreachable_branches, remove_noncode_lines
 from .utils import (
@@ -67,6 +68,7 @@ class ExclusionOptions:
     exclude_function_lines: bool = False
     exclude_internal_functions: bool = False
     exclude_noncode_lines: bool = False
+    source_analysis_cache_dir: str | None = None
 
 
 def get_exclusion_options_from_options(options: Options) -> ExclusionOptions:
@@ -84,6 +86,7 @@ def get_exclusion_options_from_options(options: Options) -> ExclusionOptions:
         exclude_function_lines=options.exclude_function_lines,
         exclude_internal_functions=options.exclude_internal_functions,
         exclude_noncode_lines=options.exclude_noncode_lines,
+        source_analysis_cache_dir=options.source_analysis_cache_dir,
     )
 
 
@@ -100,6 +103,19 @@ def apply_all_exclusions(
     Modifies the FileCoverage in place.
     """
 
+    analysis = SourceAnalysis(None, None, None)
+    if options.source_analysis_cache_dir is not None and lines:
+        analysis = get_source_analysis(
+            options.source_analysis_cache_dir,
+            lines,
+            respect_exclusion_markers=options.respect_exclusion_markers,
+            exclude_pattern_prefix=options.exclude_pattern_prefix,
+            exclude_lines_by_pattern=options.exclude_lines_by_pattern,
+            exclude_branches_by_pattern=options.exclude_branches_by_pattern,
+            exclude_noncode_lines=options.exclude_noncode_lines,
+            exclude_unreachable_branches=options.exclude_unreachable_branches,
+        )
+
     if options.exclude_internal_functions:
         remove_internal_functions(
             filecov, activate_trace_logging=activate_trace_logging
@@ -110,12 +126,18 @@ def apply_all_exclusions(
 
     if options.exclude_unreachable_branches:
         remove_unreachable_branches(
-            filecov, lines=lines, activate_trace_logging=activate_trace_logging
+            filecov,
+            lines=lines,
+            activate_trace_logging=activate_trace_logging,
+            lines_without_branches=analysis.lines_without_branches,
         )
 
     if options.exclude_noncode_lines:
         remove_noncode_lines(
-            filecov, lines=lines, activate_trace_logging=activate_trace_logging
+            filecov,
+            lines=lines,
+            activate_trace_logging=activate_trace_logging,
+            non_code_lines=analysis.non_code_lines,
         )
 
     if options.respect_exclusion_markers:
@@ -127,6 +149,7 @@ def apply_all_exclusions(
             exclude_pattern_prefix=options.exclude_pattern_prefix,
             warn_excluded_lines_with_hits=options.warn_excluded_lines_with_hits,
             activate_trace_logging=activate_trace_logging,
+            markers=analysis.markers,
         )
 
     if options.exclude_function_lines:
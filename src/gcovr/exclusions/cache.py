@@ -0,0 +1,220 @@
+# -*- coding:utf-8 -*-
+
+#  ************************** Copyrights and license ***************************
+#
+# This file is part of gcovr 8.6+main, a parsing and reporting tool for gcov.
+# https://gcovr.com/en/main
+#
+# _____________________________________________________________________________
+#
+# Copyright (c) 2013-2026 the gcovr authors
+# Copyright (c) 2013 Sandia Corporation.
+# Under the terms of Contract DE-AC04-94AL85000 with Sandia Corporation,
+# the U.S. Government retains certain rights in this software.
+#
+# This software is distributed under the 3-clause BSD License.
+# For more information, see the README.rst file.
+#
+# ****************************************************************************
+
+"""
+Persistent cache for the analysis of the source code used by the exclusions.
+
+The exclusion markers and the detection of non code lines only depend on the
+source code, the options and the version of gcovr. The results are stored in
+a directory with one JSON file per analysis named by a hash of these inputs,
+this way they can be reused by later runs if the source file is unchanged.
+"""
+
+from dataclasses import asdict, dataclass
+from hashlib import sha256
+import json
+import os
+import re
+import threading
+from typing import Any
+
+from ..logging import LOGGER
+from ..utils import get_cache_file, get_source_cache, limit_cache_size
+from ..version import __version__
+from .markers import SourceMarkers, find_source_markers
+from .noncode import find_lines_without_branches, find_noncode_lines
+
+CACHE_SIZE_LIMIT = 256 * 1024 * 1024
+"""Size limit of the cache directory, the least recently used entries are removed
+at the first access in a run if the limit is exceeded."""
+
+CACHE_FORMAT_VERSION = 2
+"""Version of the analysis, must be increased if the result of the analysis is changed."""
+
+
+@dataclass
+class SourceAnalysis:
+    """The analysis of a source file, None if not needed by the options."""
+
+    markers: SourceMarkers | None
+    """The exclusion markers."""
+    non_code_lines: set[int] | None
+    """The lines which look like non-code."""
+    lines_without_branches: set[int] | None
+    """The lines which look like they can't contain branches."""
+
+
+def get_source_analysis(
+    cache_dir: str,
+    lines: list[str],
+    *,
+    respect_exclusion_markers: bool,
+    exclude_pattern_prefix: str,
+    exclude_lines_by_pattern: list[re.Pattern[str]],
+    exclude_branches_by_pattern: list[re.Pattern[str]],
+    exclude_noncode_lines: bool,
+    exclude_unreachable_branches: bool,
+) -> SourceAnalysis:
+    """Get the analysis of the source lines from the cache directory or analyze them."""
+    source_cache = get_source_cache(lines)
+    hash_ = sha256()
+    for item in (
+        __version__,
+        str(CACHE_FORMAT_VERSION),
+        source_cache.digest,
+        str(respect_exclusion_markers),
+        exclude_pattern_prefix,
+        *(f"{pattern.flags}:{pattern.pattern}" for pattern in exclude_lines_by_pattern),
+        "",
+        *(
+            f"{pattern.flags}:{pattern.pattern}"
+            for pattern in exclude_branches_by_pattern
+        ),
+        "",
+        str(exclude_noncode_lines),
+        str(exclude_unreachable_branches),
+    ):
+        hash_.update(item.encode("utf-8", errors="surrogatepass"))
+        hash_.update(b"\0")
+    key = hash_.hexdigest()
+
+    return source_cache.get(
+        ("analysis", key),
+        lambda: _read_or_analyze(
+            cache_dir,
+            key,
+            lines,
+            respect_exclusion_markers=respect_exclusion_markers,
+            exclude_pattern_prefix=exclude_pattern_prefix,
+            exclude_lines_by_pattern=exclude_lines_by_pattern,
+            exclude_branches_by_pattern=exclude_branches_by_pattern,
+            exclude_noncode_lines=exclude_noncode_lines,
+            exclude_unreachable_branches=exclude_unreachable_branches,
+        ),
+    )
+
+
+def _read_or_analyze(
+    cache_dir: str,
+    key: str,
+    lines: list[str],
+    *,
+    respect_exclusion_markers: bool,
+    exclude_pattern_prefix: str,
+    exclude_lines_by_pattern: list[re.Pattern[str]],
+    exclude_branches_by_pattern: list[re.Pattern[str]],
+    exclude_noncode_lines: bool,
+    exclude_unreachable_branches: bool,
+) -> SourceAnalysis:
+    """Read the analysis from the cache directory or analyze the lines and store the result."""
+    analysis = None
+    limit_cache_size(cache_dir, CACHE_SIZE_LIMIT)
+    cache_file = get_cache_file(cache_dir, key)
+    try:
+        with open(cache_file, encoding="utf-8") as fh_in:
+            analysis = _deserialize(json.load(fh_in))
+        # Update the modification time for the eviction of the least recently used entries
+        os.utime(cache_file)
+    except FileNotFoundError:
+        pass
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        LOGGER.warning("Ignoring invalid source analysis cache %s: %s", cache_file, e)
+
+    if analysis is None:
+        analysis = SourceAnalysis(
+            markers=(
+                find_source_markers(
+                    lines,
+                    exclude_pattern_prefix,
+                    tuple(exclude_lines_by_pattern),
+                    tuple(exclude_branches_by_pattern),
+                )
+                if respect_exclusion_markers
+                else None
+            ),
+            non_code_lines=(
+                find_noncode_lines(lines) if exclude_noncode_lines else None
+            ),
+            lines_without_branches=(
+                find_lines_without_branches(lines)
+                if exclude_unreachable_branches
+                else None
+            ),
+        )
+        try:
+            os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+            # Write to a temporary file first, the cache may be used by parallel processes.
+            temp_file = f"{cache_file}.{os.getpid()}.{threading.get_ident()}"
+            with open(temp_file, "w", encoding="utf-8") as fh_out:
+                json.dump(_serialize(analysis), fh_out)
+            os.replace(temp_file, cache_file)
+        except OSError as e:
+            LOGGER.warning("Can't write source analysis cache %s: %s", cache_file, e)
+
+    return analysis
+
+
+def _serialize(analysis: SourceAnalysis) -> dict[str, Any]:
+    """Serialize the analysis to a JSON compatible dictionary."""
+    return {
+        "markers": None if analysis.markers is None else asdict(analysis.markers),
+        "non_code_lines": (
+            None if analysis.non_code_lines is None else sorted(analysis.non_code_lines)
+        ),
+        "lines_without_branches": (
+            None
+            if analysis.lines_without_branches is None
+            else sorted(analysis.lines_without_branches)
+        ),
+    }
+
+
+def _deserialize(data_dict: dict[str, Any]) -> SourceAnalysis:
+    """Deserialize the analysis from a dictionary created by _serialize."""
+    markers = data_dict["markers"]
+    return SourceAnalysis(
+        markers=(
+            None
+            if markers is None
+            else SourceMarkers(
+                excl_pattern_line=markers["excl_pattern_line"],
+                excl_pattern_branch=markers["excl_pattern_branch"],
+                line=[
+                    (lineno, [tuple(m) for m in line_markers], custom_match)
+                    for lineno, line_markers, custom_match in markers["line"]
+                ],
+                branch=[
+                    (lineno, [tuple(m) for m in line_markers], custom_match)
+                    for lineno, line_markers, custom_match in markers["branch"]
+                ],
+                source_branch=[tuple(m) for m in markers["source_branch"]],
+                branch_without_hit=[tuple(m) for m in markers["branch_without_hit"]],
+            )
+        ),
+        non_code_lines=(
+            None
+            if data_dict["non_code_lines"] is None
+            else set(data_dict["non_code_lines"])
+        ),
+        lines_without_branches=(
+            None
+            if data_dict["lines_without_branches"] is None
+            else set(data_dict["lines_without_branches"])
+        ),
+    )
@@ -21,6 +21,7 @@
 Handle explicit exclusion markers in source code, e.g. ``GCOVR_EXCL_LINE``.
 """
 
+from dataclasses import dataclass
 from typing import Callable
 import re
 
@@ -31,8 +32,14 @@ from .utils import (
     get_functions_by_line,
 )
 
-from ..data_model.coverage import FileCoverage, FunctionCoverage
+from ..data_model.coverage import (
+    BranchCoverage,
+    FileCoverage,
+    FunctionCoverage,
+    LineCoverage,
+)
 from ..logging import LOGGER
+from ..utils import get_source_cache
 
 
 _EXCLUDE_FLAG = "_EXCL_"
@@ -78,6 +85,7 @@ def apply_exclusion_markers(
     exclude_pattern_prefix: str,
     warn_excluded_lines_with_hits: bool,
     activate_trace_logging: bool,
+    markers: "SourceMarkers | None" = None,
 ) -> None:
     """
     Remove any coverage information that is excluded by explicit markers such as
@@ -93,28 +101,32 @@ def apply_exclusion_markers(
         exclude_branches_by_pattern: list of regular expressions to exclude
             individual branches
         exclude_pattern_prefix: string with prefix for _LINE/_START/_STOP markers.
+        markers: the already searched markers of the lines, e.g. from a cache.
     """
 
+    if markers is None:
+        markers = _get_source_markers(
+            lines,
+            exclude_pattern_prefix,
+            tuple(exclude_lines_by_pattern),
+            tuple(exclude_branches_by_pattern),
+        )
+
     _process_exclude_branch_source(
-        lines=lines,
-        exclude_pattern_prefix=exclude_pattern_prefix,
+        markers,
         filecov=filecov,
         activate_trace_logging=activate_trace_logging,
     )
 
     _process_exclude_branch_with_no_hit(
-        lines=lines,
-        exclude_pattern_prefix=exclude_pattern_prefix,
+        markers,
         filecov=filecov,
         activate_trace_logging=activate_trace_logging,
     )
 
     line_is_excluded, branch_is_excluded = _find_excluded_ranges(
-        lines=lines,
+        markers,
         warnings=_ExclusionRangeWarnings(filecov.filename),
-        exclude_lines_by_custom_patterns=exclude_lines_by_pattern,
-        exclude_branches_by_custom_patterns=exclude_branches_by_pattern,
-        exclude_pattern_prefix=exclude_pattern_prefix,
         filecov=filecov,
         activate_trace_logging=activate_trace_logging,
     )
@@ -127,123 +139,324 @@ def apply_exclusion_markers(
     )
 
 
-def _process_exclude_branch_source(
+@dataclass(frozen=True)
+class SourceMarkers:
+    """The exclusion markers of a source file.
+
+    They only depend on the source code and the options, therefore they are
+    searched only once for each source file and reused for each coverage data
+    of the file, e.g. a header included in several translation units.
+    """
+
+    excl_pattern_line: str
+    """The pattern used to search the line markers."""
+    excl_pattern_branch: str
+    """The pattern used to search the branch markers."""
+    line: list[tuple[int, list[tuple[int, str, str]], bool]]
+    """Line number, markers as (column, header, flag) and match of a custom pattern for line exclusions."""
+    branch: list[tuple[int, list[tuple[int, str, str]], bool]]
+    """Line number, markers as (column, header, flag) and match of a custom pattern for branch exclusions."""
+    source_branch: list[tuple[int, int]]
+    """Line and column of the source branch exclusion markers."""
+    branch_without_hit: list[tuple[int, int, str, str, str]]
+    """Line, column, statistic, uncovered and total branches of the markers for branches without a hit."""
+
+
+def _get_source_markers(
     lines: list[str],
-    *,
     exclude_pattern_prefix: str,
-    filecov: FileCoverage,
-    activate_trace_logging: bool,
-) -> None:
-    """Scan through all lines to find source branch exclusion markers."""
+    exclude_lines_by_custom_patterns: tuple[re.Pattern[str], ...],
+    exclude_branches_by_custom_patterns: tuple[re.Pattern[str], ...],
+) -> SourceMarkers:
+    """Get the exclusion markers from the cache or scan the lines if not cached."""
+    return get_source_cache(lines).get(
+        (
+            "markers",
+            exclude_pattern_prefix,
+            exclude_lines_by_custom_patterns,
+            exclude_branches_by_custom_patterns,
+        ),
+        lambda: find_source_markers(
+            lines,
+            exclude_pattern_prefix,
+            exclude_lines_by_custom_patterns,
+            exclude_branches_by_custom_patterns,
+        ),
+    )
+
+
+_REGEX_SPECIAL_CHARACTERS = frozenset(".^$*+?{}[]\\|()")
+_REGEX_SKIPPABLE_TOKENS = (".", r"\s", r"\S", r"\w", r"\W", r"\d", r"\D")
+
+
+def _get_required_literal(pattern: re.Pattern[str]) -> str | None:
+    r"""
+    Get a literal text which must be contained in each line matched by the pattern.
+
+    Only simple patterns starting with optional tokens followed by a literal text
+    are analyzed, for all other patterns None is returned.
+
+    >>> _get_required_literal(re.compile("LCOV_EXCL_LINE"))
+    'LCOV_EXCL_LINE'
+    >>> _get_required_literal(re.compile(r".*// IGNORE\b"))
+    '// IGNORE'
+    >>> _get_required_literal(re.compile(r"\s*assert\("))
+    'assert'
+    >>> _get_required_literal(re.compile(r"\s*abcd?"))
+    'abc'
+    >>> _get_required_literal(re.compile(r"\s+abc")) is None
+    True
+    >>> _get_required_literal(re.compile(r".*(abc|def)")) is None
+    True
+    >>> _get_required_literal(re.compile("foo|bar")) is None
+    True
+    >>> _get_required_literal(re.compile("abc", re.IGNORECASE)) is None
+    True
+    """
+    if "|" in pattern.pattern or pattern.flags & (re.IGNORECASE | re.VERBOSE):
+        return None
+
+    text = pattern.pattern
+    # Skip leading tokens which can also match an empty string
+    skipped = True
+    while skipped:
+        skipped = False
+        for token in _REGEX_SKIPPABLE_TOKENS:
+            for quantifier in ("*?", "*"):
+                if text.startswith(token + quantifier):
+                    text = text[len(token + quantifier) :]
+                    skipped = True
+                    break
+            if skipped:
+                break
+
+    length = 0
+    while length < len(text) and text[length] not in _REGEX_SPECIAL_CHARACTERS:
+        length += 1
+    # The last character is optional or repeated if followed by a quantifier
+    if length < len(text) and text[length] in "*+?{":
+        length -= 1
+
+    return text[:length] if length > 0 else None
+
+
+def find_source_markers(
+    lines: list[str],
+    exclude_pattern_prefix: str,
+    exclude_lines_by_custom_patterns: tuple[re.Pattern[str], ...],
+    exclude_branches_by_custom_patterns: tuple[re.Pattern[str], ...],
+) -> SourceMarkers:
+    """
+    Scan through all lines to find the exclusion markers.
+
+    The lines are scanned only once, the markers are only searched in lines
+    containing the exclude flag and the custom patterns are only matched
+    against lines containing their literal text (if it can be determined).
+
+    >>> markers = find_source_markers(
+    ...     [
+    ...         "a // LCOV_EXCL_LINE GCOVR_EXCL_BR_START",
+    ...         "b // GCOVR_EXCL_BR_SOURCE",
+    ...         "c // GCOVR_EXCL_BR_WITHOUT_HIT: 1/2",
+    ...         "d // GCOVR_EXCL_BR_STOP",
+    ...         "e // IGNORE",
+    ...     ],
+    ...     "[GL]COVR?",
+    ...     (re.compile(".*IGNORE"),),
+    ...     (),
+    ... )
+    >>> markers.line
+    [(1, [(6, 'LCOV', 'LINE')], False), (5, [], True)]
+    >>> markers.branch
+    [(1, [(21, 'GCOVR', 'START')], False), (4, [(6, 'GCOVR', 'STOP')], False)]
+    >>> markers.source_branch
+    [(2, 6)]
+    >>> markers.branch_without_hit
+    [(3, 6, '1/2', '1', '2')]
+    """
 
-    excl_pattern = f"(.*?)({exclude_pattern_prefix}{_EXCLUDE_PATTERN_SUFFIX_SOURCE_BRANCH_EXCLUSION})"
-    excl_pattern_compiled = re.compile(excl_pattern)
+    excl_pattern_line = f"(.*?)(({exclude_pattern_prefix}){_EXCLUDE_FLAG}{_EXCLUDE_PATTERN_LINE}({'|'.join(_EXCLUDE_PATTERN_SUFFIXES)}))"
+    excl_pattern_branch = f"(.*?)(({exclude_pattern_prefix}){_EXCLUDE_FLAG}{_EXCLUDE_PATTERN_BRANCH}({'|'.join(_EXCLUDE_PATTERN_SUFFIXES)}))"
 
+    # One pattern for all markers, the named groups are used to classify the match.
+    excl_pattern_compiled = re.compile(
+        f"(?P<header>{exclude_pattern_prefix})"
+        f"(?:{_EXCLUDE_FLAG}(?P<branch>{_EXCLUDE_PATTERN_BRANCH})?(?P<flag>{'|'.join(_EXCLUDE_PATTERN_SUFFIXES)})"
+        f"|(?P<source>{_EXCLUDE_PATTERN_SUFFIX_SOURCE_BRANCH_EXCLUSION})"
+        f"|(?P<without_hit>{_EXCLUDE_PATTERN_SUFFIX_BRANCH_WITHOUT_HIT_EXCLUSION}))"
+    )
+    line_custom_patterns = [
+        (_get_required_literal(p), p) for p in exclude_lines_by_custom_patterns
+    ]
+    branch_custom_patterns = [
+        (_get_required_literal(p), p) for p in exclude_branches_by_custom_patterns
+    ]
+
+    line = list[tuple[int, list[tuple[int, str, str]], bool]]()
+    branch = list[tuple[int, list[tuple[int, str, str]], bool]]()
+    source_branch = list[tuple[int, int]]()
+    branch_without_hit = list[tuple[int, int, str, str, str]]()
     for lineno, code in enumerate(lines, 1):
+        line_markers = list[tuple[int, str, str]]()
+        branch_markers = list[tuple[int, str, str]]()
         if _EXCLUDE_FLAG in code:
-            columnno = 1
-            for prefix, match in excl_pattern_compiled.findall(code):
-                columnno += len(prefix)
-                location = f"{filecov.filename}:{lineno}:{columnno}"
-                linecovs = filecov.get_line(lineno)
-                if linecovs is None:
+            for match in excl_pattern_compiled.finditer(code):
+                columnno = match.start() + 1
+                if match["flag"] is not None:
+                    (branch_markers if match["branch"] else line_markers).append(
+                        (columnno, match["header"], match["flag"])
+                    )
+                elif match["source"] is not None:
+                    source_branch.append((lineno, columnno))
+                else:
+                    stats_string, uncovered, total = match.groups()[-3:]
+                    branch_without_hit.append(
+                        (lineno, columnno, stats_string, uncovered, total)
+                    )
+
+        custom_match = any(
+            (literal is None or literal in code) and p.match(code)
+            for literal, p in line_custom_patterns
+        )
+        if line_markers or custom_match:
+            line.append((lineno, line_markers, custom_match))
+
+        custom_match = any(
+            (literal is None or literal in code) and p.match(code)
+            for literal, p in branch_custom_patterns
+        )
+        if branch_markers or custom_match:
+            branch.append((lineno, branch_markers, custom_match))
+
+    return SourceMarkers(
+        excl_pattern_line=excl_pattern_line,
+        excl_pattern_branch=excl_pattern_branch,
+        line=line,
+        branch=branch,
+        source_branch=source_branch,
+        branch_without_hit=branch_without_hit,
+    )
+
+
+def _process_exclude_branch_source(
+    markers: SourceMarkers,
+    *,
+    filecov: FileCoverage,
+    activate_trace_logging: bool,
+) -> None:
+    """Process the source branch exclusion markers."""
+
+    branches_by_destination = None
+    for lineno, columnno in markers.source_branch:
+        location = f"{filecov.filename}:{lineno}:{columnno}"
+        linecovs = filecov.get_line(lineno)
+        if linecovs is None:
+            LOGGER.error(
+                "Found marker for source branch exclusion at %s without coverage information",
+                location,
+            )
+        else:
+            for linecov in linecovs.linecov():
+                if linecov.function_name is None or linecov.block_ids is None:
+                    LOGGER.warning(
+                        "Source branch exclusion at %s needs at least gcc-14 with supported JSON format.",
+                        location,
+                    )
+                elif not linecov.block_ids:
                     LOGGER.error(
-                        "Found marker for source branch exclusion at %s without coverage information",
+                        "Source branch exclusion at %s found but no block ids defined at this line.",
                         location,
                     )
                 else:
-                    for linecov in linecovs.linecov():
-                        if linecov.function_name is None or linecov.block_ids is None:
-                            LOGGER.warning(
-                                "Source branch exclusion at %s needs at least gcc-14 with supported JSON format.",
-                                location,
+                    if branches_by_destination is None:
+                        branches_by_destination = _get_branches_by_destination(filecov)
+                    # Exclude the branches of the function where the destination is one of the blocks of the line with the marker
+                    for _, cur_linecov, cur_branchcov in sorted(
+                        (
+                            branch
+                            for block_id in set(linecov.block_ids)
+                            for branch in branches_by_destination.get(
+                                (linecov.function_name, block_id), []
+                            )
+                        ),
+                        key=lambda branch: branch[0],
+                    ):
+                        if activate_trace_logging:
+                            branch_info = (
+                                f"{cur_branchcov.source_block_id}->{cur_branchcov.destination_block_id}"
+                                if cur_branchcov.branchno is None
+                                else f"{cur_branchcov.branchno}"
                             )
-                        elif not linecov.block_ids:
-                            LOGGER.error(
-                                "Source branch exclusion at %s found but no block ids defined at this line.",
+                            LOGGER.trace(
+                                "Source branch exclusion at %s is excluding branch %s of line %s",
                                 location,
+                                branch_info,
+                                cur_linecov.lineno,
                             )
-                        else:
-                            function_name = linecov.function_name
-                            block_ids = linecov.block_ids or []
-                            # Check the lines which belong to the function
-                            for cur_linecov in filecov.linecov():
-                                if cur_linecov.function_name != function_name:
-                                    continue
-                                # Exclude the branch where the destination is one of the blocks of the line with the marker
-                                for cur_branchcov in cur_linecov.branches():
-                                    if cur_branchcov.destination_block_id in block_ids:
-                                        if activate_trace_logging:
-                                            branch_info = (
-                                                f"{cur_branchcov.source_block_id}->{cur_branchcov.destination_block_id}"
-                                                if cur_branchcov.branchno is None
-                                                else f"{cur_branchcov.branchno}"
-                                            )
-                                            LOGGER.trace(
-                                                "Source branch exclusion at %s is excluding branch %s of line %s",
-                                                location,
-                                                branch_info,
-                                                cur_linecov.lineno,
-                                            )
-                                        cur_branchcov.excluded = True
-                columnno += len(match)
+                        cur_branchcov.excluded = True
+
+
+def _get_branches_by_destination(
+    filecov: FileCoverage,
+) -> dict[
+    tuple[str | None, int | None], list[tuple[int, LineCoverage, BranchCoverage]]
+]:
+    """Get the branches of the file indexed by function name and destination block id.
+
+    The branches are stored with their position in the file to keep the order of the file.
+    """
+    branches_by_destination = dict[
+        tuple[str | None, int | None],
+        list[tuple[int, LineCoverage, BranchCoverage]],
+    ]()
+    position = 0
+    for linecov in filecov.linecov():
+        for branchcov in linecov.branches():
+            branches_by_destination.setdefault(
+                (linecov.function_name, branchcov.destination_block_id), []
+            ).append((position, linecov, branchcov))
+            position += 1
+
+    return branches_by_destination
 
 
 def _process_exclude_branch_with_no_hit(
-    lines: list[str],
+    markers: SourceMarkers,
     *,
-    exclude_pattern_prefix: str,
     filecov: FileCoverage,
     activate_trace_logging: bool,
 ) -> None:
-    """Scan through all lines to find exclusion markers for branches without a hit."""
-
-    excl_pattern = rf"(.*?)({exclude_pattern_prefix}{_EXCLUDE_PATTERN_SUFFIX_BRANCH_WITHOUT_HIT_EXCLUSION})"
-    excl_pattern_compiled = re.compile(excl_pattern)
-
-    for lineno, code in enumerate(lines, 1):
-        if _EXCLUDE_FLAG in code:
-            columnno = 1
-            for (
-                prefix,
-                match,
-                stats_string,
-                uncovered,
-                total,
-            ) in excl_pattern_compiled.findall(code):
-                columnno += len(prefix)
-                location = f"{filecov.filename}:{lineno}:{columnno}"
-                linecovs = filecov.get_line(lineno)
-                if linecovs is None:
+    """Process the exclusion markers for branches without a hit."""
+
+    for lineno, columnno, stats_string, uncovered, total in markers.branch_without_hit:
+        location = f"{filecov.filename}:{lineno}:{columnno}"
+        linecovs = filecov.get_line(lineno)
+        if linecovs is None:
+            LOGGER.error(
+                "Found marker for exclusion of branches without hits at %s without coverage information",
+                location,
+            )
+        else:
+            for linecov in linecovs.linecov():
+                stats = linecov.branch_coverage()
+                expected_uncovered = stats.total - stats.covered
+                if str(stats.total) == total and str(expected_uncovered) == uncovered:
+                    if activate_trace_logging:
+                        LOGGER.trace(
+                            "Exclusion of branches without hits at %s is excluding %s branch(es)",
+                            location,
+                            uncovered,
+                        )
+                    linecov.exclude_branches()
+                else:
                     LOGGER.error(
-                        "Found marker for exclusion of branches without hits at %s without coverage information",
+                        "Exclusion of branches without hits (%s) at %s is wrong. There %s %s out of %s branches uncovered",
+                        stats_string,
                         location,
+                        "is" if expected_uncovered <= 1 else "are",
+                        expected_uncovered,
+                        stats.total,
                     )
-                else:
-                    for linecov in linecovs.linecov():
-                        stats = linecov.branch_coverage()
-                        expected_uncovered = stats.total - stats.covered
-                        if (
-                            str(stats.total) == total
-                            and str(expected_uncovered) == uncovered
-                        ):
-                            if activate_trace_logging:
-                                LOGGER.trace(
-                                    "Exclusion of branches without hits at %s is excluding %s branch(es)",
-                                    location,
-                                    uncovered,
-                                )
-                            linecov.exclude_branches()
-                        else:
-                            LOGGER.error(
-                                "Exclusion of branches without hits (%s) at %s is wrong. There %s %s out of %s branches uncovered",
-                                stats_string,
-                                location,
-                                "is" if expected_uncovered <= 1 else "are",
-                                expected_uncovered,
-                                stats.total,
-                            )
-                columnno += len(match)
 
 
 class _ExclusionRangeWarnings:
@@ -386,17 +599,14 @@ def _process_exclusion_marker(
 
 
 def _find_excluded_ranges(
-    lines: list[str],
+    markers: SourceMarkers,
     *,
     warnings: _ExclusionRangeWarnings,
-    exclude_pattern_prefix: str,
-    exclude_lines_by_custom_patterns: list[re.Pattern[str]],
-    exclude_branches_by_custom_patterns: list[re.Pattern[str]],
     filecov: FileCoverage,
     activate_trace_logging: bool = False,
 ) -> tuple[ExclusionPredicate, ExclusionPredicate]:
     """
-    Scan through all lines to find line ranges and branch ranges covered by exclusion markers.
+    Get the line ranges and branch ranges covered by exclusion markers.
 
     Example:
     >>> from .utils import _lines_from_sparse
@@ -406,25 +616,21 @@ def _find_excluded_ranges(
     ...     (15, '//PREFIX_EXCL_START'), (18, '//PREFIX_EXCL_STOP'),
     ...     (21, '//PREFIX_EXCL_BR_LINE'), (23, '//IGNORE_BR'),
     ...     (25, '//PREFIX_EXCL_BR_START'), (28, '//PREFIX_EXCL_BR_STOP')]
+    >>> markers = find_source_markers(
+    ...     _lines_from_sparse(lines), 'PREFIX',
+    ...     (re.compile('.*IGNORE_LINE'),), (re.compile('.*IGNORE_BR'),))
     >>> exclude_line, exclude_branch = _find_excluded_ranges(
-    ...     _lines_from_sparse(lines), warnings=...,
-    ...     exclude_lines_by_custom_patterns=[re.compile('.*IGNORE_LINE')],
-    ...     exclude_branches_by_custom_patterns=[re.compile('.*IGNORE_BR')],
-    ...     exclude_pattern_prefix='PREFIX',
-    ...     filecov=None)
+    ...     markers, warnings=..., filecov=None)
     >>> [lineno for lineno in range(30) if exclude_line(lineno)]
     [11, 13, 15, 16, 17]
     >>> [lineno for lineno in range(30) if exclude_branch(lineno)]
     [21, 23, 25, 26, 27]
 
     The stop marker line is NOT inclusive:
-    >>> exclude_line, _ = _find_excluded_ranges(
+    >>> markers = find_source_markers(
     ...     _lines_from_sparse([(3, '// PREFIX_EXCL_START'), (7, '// PREFIX_EXCL_STOP')]),
-    ...     warnings=...,
-    ...     exclude_lines_by_custom_patterns=[],
-    ...     exclude_branches_by_custom_patterns=[],
-    ...     exclude_pattern_prefix='PREFIX',
-    ...     filecov=None)
+    ...     'PREFIX', (), ())
+    >>> exclude_line, _ = _find_excluded_ranges(markers, warnings=..., filecov=None)
     >>> for lineno in range(1, 10):
     ...     print(f"{lineno}: {'excluded' if exclude_line(lineno) else 'code'}")
     1: code
@@ -441,35 +647,29 @@ def _find_excluded_ranges(
     functions_by_line: FunctionListByLine = get_functions_by_line(filecov)
 
     def find_range_impl(
-        custom_patterns: list[re.Pattern[str]],
+        excl_pattern: str,
+        range_markers: list[tuple[int, list[tuple[int, str, str]], bool]],
         exclude_word: str,
     ) -> ExclusionPredicate:
-        excl_pattern = f"(.*?)(({exclude_pattern_prefix}){_EXCLUDE_FLAG}{exclude_word}({'|'.join(_EXCLUDE_PATTERN_SUFFIXES)}))"
-        excl_pattern_compiled = re.compile(excl_pattern)
-
         # possibly overlapping inclusive (closed) ranges that describe exclusions regions
         exclude_ranges = list[tuple[int, int]]()
         exclusion_stack = list[tuple[str, int]]()
 
-        for lineno, code in enumerate(lines, 1):
-            if _EXCLUDE_FLAG in code:
-                columnno = 1
-                for prefix, match, header, flag in excl_pattern_compiled.findall(code):
-                    columnno += len(prefix)
-                    _process_exclusion_marker(
-                        lineno,
-                        columnno,
-                        flag,
-                        header,
-                        exclude_word,
-                        warnings,
-                        functions_by_line,
-                        exclude_ranges,
-                        exclusion_stack,
-                    )
-                    columnno += len(match)
+        for lineno, line_markers, custom_match in range_markers:
+            for columnno, header, flag in line_markers:
+                _process_exclusion_marker(
+                    lineno,
+                    columnno,
+                    flag,
+                    header,
+                    exclude_word,
+                    warnings,
+                    functions_by_line,
+                    exclude_ranges,
+                    exclusion_stack,
+                )
 
-            if any(p.match(code) for p in custom_patterns):
+            if custom_match:
                 exclude_ranges.append((lineno, lineno))
 
         for header, lineno in exclusion_stack:
@@ -487,6 +687,8 @@ def _find_excluded_ranges(
         return make_is_in_any_range_inclusive(exclude_ranges)
 
     return (
-        find_range_impl(exclude_lines_by_custom_patterns, _EXCLUDE_PATTERN_LINE),
-        find_range_impl(exclude_branches_by_custom_patterns, _EXCLUDE_PATTERN_BRANCH),
+        find_range_impl(markers.excl_pattern_line, markers.line, _EXCLUDE_PATTERN_LINE),
+        find_range_impl(
+            markers.excl_pattern_branch, markers.branch, _EXCLUDE_PATTERN_BRANCH
+        ),
     )
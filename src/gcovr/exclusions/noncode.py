@@ -25,22 +25,98 @@ import re
 
 from ..data_model.coverage import FileCoverage
 from ..logging import LOGGER
+from ..utils import get_source_cache
+
+
+# The literals and numbers are matched to ignore comment markers inside them:
+# - raw string literals (they can span several lines),
+# - string and character literals,
+# - numbers with digit separators, e.g. 1'000, which aren't character literals.
+_COMMENT_OR_LITERAL_PATTERN = re.compile(
+    r"""//[^\n]*|/\*.*?\*/"""
+    r"""|\b(?:u8|[uUL])?R"([^()\\\s"]{0,16})\(.*?\)\1\""""
+    r"""|"(?:\\.|[^"\\\n])*"|'(?:\\.|[^'\\\n])*'"""
+    r"""|\b\d(?:\w|\.|'(?=\w))*""",
+    re.DOTALL,
+)
+_WHITESPACE_PATTERN = re.compile(r"\s+")
 
 
-_C_STYLE_COMMENT_PATTERN = re.compile(r"/\*.*?\*/")
-_CPP_STYLE_COMMENT_PATTERN = re.compile(r"//.*?$")
-_WHITESPACE_PATTERN = re.compile(r"\s+")
+def get_lines_without_comments(lines: list[str]) -> list[str]:
+    r"""
+    Get the source lines with the comments replaced by a space.
+
+    The comments are removed from the whole text at once, this way the lines
+    of a comment over several lines are also detected.
+
+    >>> get_lines_without_comments(['a = 1; // comment', 'b /* c */ = 2; /* start', ' * more', 'end */ }'])
+    ['a = 1;  ', 'b   = 2;  ', '', ' }']
+    >>> get_lines_without_comments(['s = "/* no comment"; // comment', 'c = "\\"//";'])
+    ['s = "/* no comment";  ', 'c = "\\"//";']
+
+    Raw string literals can contain quotes and span several lines:
+    >>> get_lines_without_comments(['s = R"x(/* ")', '// no comment)x"; // comment'])
+    ['s = R"x(/* ")', '// no comment)x";  ']
+
+    A digit separator doesn't start a character literal:
+    >>> get_lines_without_comments(["n = 1'000; /* comment */ c = '/';"])
+    ["n = 1'000;   c = '/';"]
+    """
+    if not lines:
+        return []
+
+    def replace_comment(match: re.Match[str]) -> str:
+        text = match.group()
+        if text.startswith(("/*", "//")):
+            # Keep the line breaks of comments over several lines
+            return " " + "\n" * text.count("\n")
+        return text
+
+    return _COMMENT_OR_LITERAL_PATTERN.sub(replace_comment, "\n".join(lines)).split(
+        "\n"
+    )
+
+
+def _get_noncode_line_numbers(lines: list[str]) -> tuple[set[int], set[int]]:
+    """Get the numbers of the non-code lines and of the lines without branches.
+
+    Both are derived from the same lines without comments, only the numbers
+    are kept in the cache of the source file.
+    """
+
+    def find_line_numbers() -> tuple[set[int], set[int]]:
+        non_code_lines = set[int]()
+        lines_without_branches = set[int]()
+        for lineno, code in enumerate(get_lines_without_comments(lines), 1):
+            if _is_non_code(code):
+                non_code_lines.add(lineno)
+            if not _line_can_contain_branches(code):
+                lines_without_branches.add(lineno)
+        return non_code_lines, lines_without_branches
+
+    return get_source_cache(lines).get("noncode_line_numbers", find_line_numbers)
 
 
 def remove_unreachable_branches(
-    filecov: FileCoverage, *, lines: list[str], activate_trace_logging: bool
+    filecov: FileCoverage,
+    *,
+    lines: list[str],
+    activate_trace_logging: bool,
+    lines_without_branches: set[int] | None = None,
 ) -> None:
-    """Remove branches on lines that look like they don't contain useful code."""
-    for linecov in filecov.linecov():
-        if not linecov.has_reportable_branches:
-            continue
+    """Remove branches on lines that look like they don't contain useful code.
+
+    If given, lines_without_branches is the result of find_lines_without_branches()
+    for the lines, e.g. from a cache.
+    """
+    if lines_without_branches is None:
+        lines_without_branches = find_lines_without_branches(lines)
 
-        if _line_can_contain_branches(lines[linecov.lineno - 1]):
+    for linecov in filecov.linecov():
+        if (
+            not linecov.has_reportable_branches
+            or linecov.lineno not in lines_without_branches
+        ):
             continue
 
         if activate_trace_logging:
@@ -53,30 +129,48 @@ def remove_unreachable_branches(
 
 def _line_can_contain_branches(code: str) -> bool:
     """
-    False if the line looks empty except for braces.
+    False if the line without comments looks empty except for braces.
 
-    >>> _line_can_contain_branches('} // end something')
-    False
-    >>> _line_can_contain_branches('\t /* comment 1 */  } /* comment 2 */ // comment 3')
+    >>> _line_can_contain_branches('  }  ')
     False
     >>> _line_can_contain_branches('foo();')
     True
     """
 
-    code = _CPP_STYLE_COMMENT_PATTERN.sub("", code)
-    code = _C_STYLE_COMMENT_PATTERN.sub("", code)
     code = _WHITESPACE_PATTERN.sub("", code)
     return code not in ["", "{", "}", "{}"]
 
 
+def find_lines_without_branches(lines: list[str]) -> set[int]:
+    """
+    Get the numbers of the lines which look like they don't contain useful code for branches.
+
+    >>> sorted(find_lines_without_branches(['} // end something', '\t /* comment 1 */  } /* comment 2 */ // comment 3', 'foo();']))
+    [1, 2]
+    >>> sorted(find_lines_without_branches(['/* comment', ' foo(); */ {', 'foo(); /* comment */']))
+    [1, 2]
+    """
+    return _get_noncode_line_numbers(lines)[1]
+
+
 def remove_noncode_lines(
-    filecov: FileCoverage, *, lines: list[str], activate_trace_logging: bool
+    filecov: FileCoverage,
+    *,
+    lines: list[str],
+    activate_trace_logging: bool,
+    non_code_lines: set[int] | None = None,
 ) -> None:
-    """Remove lines that look like non-code."""
+    """Remove lines that look like non-code.
+
+    If given, non_code_lines is the result of find_noncode_lines() for the
+    lines, e.g. from a cache.
+    """
+    if non_code_lines is None:
+        non_code_lines = find_noncode_lines(lines)
+
     # iterate over a shallow copy
     for linecov in list(filecov.linecov()):
-        source_code = lines[linecov.lineno - 1]
-        if linecov.count == 0 and _is_non_code(source_code):
+        if linecov.count == 0 and linecov.lineno in non_code_lines:
             if activate_trace_logging:
                 LOGGER.trace(
                     "%s: Removing line detected as non code",
@@ -85,34 +179,53 @@ def remove_noncode_lines(
             filecov.remove_line_coverage(linecov)
 
 
+def find_noncode_lines(lines: list[str]) -> set[int]:
+    """
+    Get the numbers of the lines which look like non-code.
+
+    Examples:
+    >>> sorted(find_noncode_lines([
+    ...     '// some comment!',
+    ...     '  /* comment 1 */ /* comment 2 */ // comment 3',
+    ...     '} else {',
+    ...     '/* comment 1 */ else /* comment 2 */',
+    ...     '/* some comment */ {',
+    ...     '} // some code',
+    ...     'return {};',
+    ...     '/* comment over',
+    ...     '   several lines */',
+    ...     'puts("/*"); // comment',
+    ...     'foo(); /* comment after code',
+    ...     '   before code */ }',
+    ...     's = R"(a"/*)";',
+    ...     'foo();',
+    ...     '} // */',
+    ... ]))
+    [1, 2, 4, 5, 6, 8, 9, 12, 15]
+    """
+    return _get_noncode_line_numbers(lines)[0]
+
+
 def _is_non_code(code: str) -> bool:
     """
-    Check for patterns that indicate that this line doesn't contain useful code.
+    Check for patterns that indicate that this line without comments doesn't contain useful code.
 
     Examples:
-    >>> _is_non_code('// some comment!')
-    True
-    >>> _is_non_code('  /* comment 1 */ /* comment 2 */ // comment 3')
+    >>> _is_non_code('  ')
     True
     >>> _is_non_code('} else {')  # could be easily made detectable
     False
     >>> _is_non_code('}else{')
     False
-    >>> _is_non_code('/* comment 1 */ else /* comment 2 */')
+    >>> _is_non_code('  else  ')
     True
     >>> _is_non_code('{')
     True
-    >>> _is_non_code('/* some comment */ {')
-    True
     >>> _is_non_code('}')
     True
-    >>> _is_non_code('} // some code')
-    True
     >>> _is_non_code('return {};')
     False
     """
 
-    code = _CPP_STYLE_COMMENT_PATTERN.sub("", code)
-    code = _C_STYLE_COMMENT_PATTERN.sub("", code)
     code = _WHITESPACE_PATTERN.sub("", code)
     return len(code) == 0 or code in ["{", "}", "else"]
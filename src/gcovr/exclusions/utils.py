@@ -19,6 +19,7 @@
 
 """Utils for exclusion of lines and branches"""
 
+from bisect import bisect_right
 from typing import Callable, Iterable
 
 from ..data_model.coverage import FileCoverage, FunctionCoverage
@@ -168,8 +169,8 @@ def make_is_in_any_range_inclusive(
     """
     Create a function to check whether an input is in any range (inclusive).
 
-    This function should provide reasonable performance
-    if queries are mostly made in ascending order.
+    The ranges are merged to sorted disjoint intervals which are searched
+    with a binary search, this way the order of the queries doesn't matter.
 
     Example:
     >>> select = make_is_in_any_range_inclusive([(3,3), (5,7)])
@@ -179,37 +180,27 @@ def make_is_in_any_range_inclusive(
     True
     >>> [x for x in range(10) if select(x)]
     [3, 5, 6, 7]
+    >>> select = make_is_in_any_range_inclusive([(8, 9), (2, 4), (3, 5), (6, 6), (11, 10)])
+    >>> [x for x in reversed(range(12)) if select(x)]
+    [9, 8, 6, 5, 4, 3, 2]
     """
 
-    # values are likely queried in ascending order,
-    # allowing the search to start with the first possible range
-    ranges = sorted(ranges)
-    hint_value = 0
-    hint_index = 0
-
-    def is_in_any_range(value: int) -> bool:
-        nonlocal hint_value, hint_index
-
-        # if the heuristic failed, restart search from the beginning
-        if value < hint_value:
-            hint_index = 0
-
-        hint_value = value
-
-        for i in range(hint_index, len(ranges)):
-            start, end = ranges[i]
-            hint_index = i
-
-            # stop as soon as a too-large range is seen
-            if value < start:
-                break
-
-            if start <= value <= end:
-                return True
+    starts = list[int]()
+    ends = list[int]()
+    for start, end in sorted(ranges):
+        if start > end:
+            continue
+        # Merge overlapping and adjacent ranges
+        if ends and start <= ends[-1] + 1:
+            ends[-1] = max(ends[-1], end)
         else:
-            hint_index = len(ranges)
+            starts.append(start)
+            ends.append(end)
 
-        return False
+    def is_in_any_range(value: int) -> bool:
+        # index of the last range starting at or before the value
+        index = bisect_right(starts, value) - 1
+        return index >= 0 and value <= ends[index]
 
     return is_in_any_range
 
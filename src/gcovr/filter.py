@@ -18,6 +18,7 @@
 # ****************************************************************************
 
 import functools
+import logging
 import platform
 import re
 import os
@@ -26,21 +27,46 @@ from .logging import LOGGER
 from .utils import force_unix_separator, is_fs_case_insensitive
 
 
+# The filters are evaluated several times for the same paths, e.g. for the trace,
+# the data and the source files, therefore the resolved paths are cached for a run.
+@functools.cache
+def _get_realpath(path: str) -> str:
+    """Get the path with all symlinks resolved."""
+    return os.path.realpath(path)
+
+
+def clear_filter_cache() -> None:
+    """Clear the cached paths and filter results, needed if gcovr is called several times in the same process."""
+    _get_realpath.cache_clear()
+    _get_combined_filter.cache_clear()
+    __is_file_matching_any.cache_clear()
+
+
 class Filter:
     """Base class for a filename filter."""
 
     def __init__(self, pattern: str) -> None:
         flags = re.IGNORECASE if is_fs_case_insensitive() else 0
         self.pattern = re.compile(pattern, flags)
+        self.default_flags = re.compile("", flags).flags
 
     def match(self, path: str) -> bool:
         """Return True if the given path (always with /) matches the regular expression."""
-        os_independent_path = force_unix_separator(path)
-        if self.pattern.match(os_independent_path):
+        os_independent_path = self.get_path_to_match(path)
+        if os_independent_path is not None and self.pattern.match(os_independent_path):
             LOGGER.debug("  Filter %s matched for path %s.", self, os_independent_path)
             return True
         return False
 
+    def get_path_to_match(self, path: str) -> str | None:
+        """Get the path (always with /) used for the regular expression, None if the filter can't match."""
+        return force_unix_separator(path)
+
+    @property
+    def group_key(self) -> tuple[object, ...]:
+        """Filters with the same key use the same path for the regular expression."""
+        return (type(self),)
+
     def __str__(self) -> str:
         return f"{type(self).__name__}({self.pattern.pattern})"
 
@@ -48,10 +74,9 @@ class Filter:
 class AbsoluteFilter(Filter):
     """Class for a filename filter which matches against the real path of a file."""
 
-    def match(self, path: str) -> bool:
-        """Return True if the given path with all symlinks resolved matches the filter."""
-        path = os.path.realpath(path)
-        return super().match(path)
+    def get_path_to_match(self, path: str) -> str | None:
+        """Get the given path with all symlinks resolved."""
+        return super().get_path_to_match(_get_realpath(path))
 
 
 class RelativeFilter(Filter):
@@ -59,11 +84,11 @@ class RelativeFilter(Filter):
 
     def __init__(self, root: str, pattern: str) -> None:
         super().__init__(pattern)
-        self.root = os.path.realpath(root)
+        self.root = _get_realpath(root)
 
-    def match(self, path: str) -> bool:
-        """Return True if the given path with all symlinks resolved matches the filter."""
-        path = os.path.realpath(path)
+    def get_path_to_match(self, path: str) -> str | None:
+        """Get the given path with all symlinks resolved relative to the root."""
+        path = _get_realpath(path)
 
         # On Windows, a relative path can never cross drive boundaries.
         # If so, the relative filter cannot match.
@@ -71,10 +96,14 @@ class RelativeFilter(Filter):
             path_drive, _ = os.path.splitdrive(path)
             root_drive, _ = os.path.splitdrive(self.root)
             if path_drive != root_drive:  # pragma: no cover
-                return False
+                return None
 
         relpath = os.path.relpath(path, self.root)
-        return super().match(relpath)
+        return super().get_path_to_match(relpath)
+
+    @property
+    def group_key(self) -> tuple[object, ...]:
+        return (type(self), self.root)
 
     def __str__(self) -> str:
         return f"RelativeFilter({self.pattern.pattern} root={self.root})"
@@ -100,10 +129,79 @@ class DirectoryPrefixFilter(Filter):
         pattern = re.escape(f"{os_independent_path}/")
         super().__init__(pattern)
 
+    def get_path_to_match(self, path: str) -> str | None:
+        """Get the normalized path."""
+        return super().get_path_to_match(os.path.normpath(path))
+
+
+class CombinedFilter:
+    r"""Match a path against several filters at once.
+
+    The regular expressions of the filters which use the same path are combined
+    to one regular expression. Regular expressions with groups (which may contain
+    backreferences) or own flags are kept separate.
+
+    >>> combined = CombinedFilter((
+    ...     DirectoryPrefixFilter("/src"),
+    ...     Filter(r"abs/.*\.h$"),
+    ...     Filter(r"abs/(a|b)/\1$"),
+    ...     Filter("other/"),
+    ... ))
+    >>> [len(patterns) for _, patterns in combined.groups]
+    [1, 2]
+    >>> [combined.match(path) for path in ("/src/a.c", "abs/x.h", "abs/a/a", "abs/a/b", "other/a.c", "b.c")]
+    [True, True, True, False, True, False]
+    >>> CombinedFilter((DirectoryPrefixFilter("/src"), AlwaysMatchFilter())).match("/b.c")
+    True
+    """
+
+    def __init__(self, filters: tuple[Filter, ...]) -> None:
+        self.always_match = any(isinstance(f, AlwaysMatchFilter) for f in filters)
+        # Other objects with a match method, e.g. a compiled regular expression, are used as they are.
+        self.others = [f for f in filters if not isinstance(f, Filter)]
+        filters_by_group = dict[tuple[object, ...], list[Filter]]()
+        for f in filters:
+            if isinstance(f, Filter) and not isinstance(f, AlwaysMatchFilter):
+                filters_by_group.setdefault(f.group_key, []).append(f)
+
+        self.groups = list[tuple[Filter, list[re.Pattern[str]]]]()
+        for group_filters in filters_by_group.values():
+            combinable = [
+                f.pattern
+                for f in group_filters
+                if f.pattern.groups == 0 and f.pattern.flags == f.default_flags
+            ]
+            patterns = [f.pattern for f in group_filters if f.pattern not in combinable]
+            if len(combinable) > 1:
+                try:
+                    combinable = [
+                        re.compile(
+                            "|".join(f"(?:{p.pattern})" for p in combinable),
+                            group_filters[0].default_flags,
+                        )
+                    ]
+                except re.error:  # pragma: no cover
+                    pass
+            # The first filter of the group is used to get the path to match.
+            self.groups.append((group_filters[0], combinable + patterns))
+
     def match(self, path: str) -> bool:
-        """Return True if the given path matches the filter."""
-        path = os.path.normpath(path)
-        return super().match(path)
+        """Return True if the given path matches any of the filters."""
+        if self.always_match:
+            return True
+        for f, patterns in self.groups:
+            path_to_match = f.get_path_to_match(path)
+            if path_to_match is not None and any(
+                pattern.match(path_to_match) for pattern in patterns
+            ):
+                return True
+        return any(f.match(path) for f in self.others)
+
+
+@functools.cache
+def _get_combined_filter(filters: tuple[Filter, ...]) -> CombinedFilter:
+    """Get the combined filter for the given filters."""
+    return CombinedFilter(filters)
 
 
 @functools.cache
@@ -111,7 +209,8 @@ def __is_file_matching_any(filename: str, filters: tuple[Filter, ...]) -> bool:
     """Check if filename matches any of the given filters.
 
     The filename is tested against all filters in the list.
-    The first matching filter causes a True result.
+    The first matching filter causes a True result. The result is
+    cached for the combination of filename and filters for a run.
 
     filename (str): the file path to match
     filters (list of Filter): the filters to test against
@@ -120,6 +219,10 @@ def __is_file_matching_any(filename: str, filters: tuple[Filter, ...]) -> bool:
         True when filename is matching any filter.
     """
 
+    # Test each filter if debug logging is active to log the matching filter.
+    if not LOGGER.isEnabledFor(logging.DEBUG):
+        return _get_combined_filter(filters).match(filename)
+
     if any(f.match(filename) for f in filters):
         return True
 
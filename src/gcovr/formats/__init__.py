@@ -90,13 +90,14 @@ def validate_options(options: Options) -> None:
 
 def read_reports(options: Options) -> CoverageContainer:
     """Read the reports from the given locations."""
-    if options.json_tracefile or options.cobertura_tracefile:
+    if options.json_tracefile or options.cobertura_tracefile or options.lcov_tracefile:
         covdata = JsonHandler(options).read_report()
         if not options.json_compare:
-            covdata.merge(
-                CoberturaHandler(options).read_report(),
-                get_merge_mode_from_options(options),
-            )
+            for handler in (CoberturaHandler, LcovHandler):
+                covdata.merge(
+                    handler(options).read_report(),
+                    get_merge_mode_from_options(options),
+                )
     elif options.llvm_profdata_cmd:
         covdata = LlvmHandler(options).read_report()
     else:
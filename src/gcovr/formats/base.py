@@ -17,7 +17,14 @@
 #
 # ****************************************************************************
 
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from multiprocessing import cpu_count
+from typing import Callable
+
 from ..data_model.container import CoverageContainer
+from ..data_model.merging import get_merge_mode_from_options
+from ..logging import LOGGER
 from ..options import GcovrConfigOption, Options
 
 
@@ -70,3 +77,42 @@ class BaseHandler:
     ) -> None:
         """Write a summary report in the format of the handler"""
         raise AssertionError("Function 'write_summary_report' not implemented.")
+
+
+def read_tracefiles(
+    read_function: Callable[[list[str], Options], CoverageContainer],
+    datafiles: list[str],
+    options: Options,
+    number_of_processes: int,
+) -> CoverageContainer:
+    """Read the tracefiles with the given function, in parallel processes if requested.
+
+    Each process reads a consecutive chunk of the tracefiles and the results are
+    merged pairwise, this keeps the order of the merge of the sequential read.
+    """
+    if number_of_processes <= 0:
+        number_of_processes = max(1, cpu_count() + number_of_processes)
+    number_of_processes = min(number_of_processes, len(datafiles))
+    if number_of_processes <= 1:
+        return read_function(datafiles, options)
+
+    LOGGER.debug("Using %d processes.", number_of_processes)
+    chunk_size = -(-len(datafiles) // number_of_processes)
+    with ProcessPoolExecutor(number_of_processes) as executor:
+        partial_covdata = list(
+            executor.map(
+                read_function,
+                [
+                    datafiles[index : index + chunk_size]
+                    for index in range(0, len(datafiles), chunk_size)
+                ],
+                repeat(options),
+            )
+        )
+    merge_options = get_merge_mode_from_options(options)
+    while len(partial_covdata) > 1:
+        for index in range(0, len(partial_covdata) - 1, 2):
+            partial_covdata[index].merge(partial_covdata[index + 1], merge_options)
+        partial_covdata = partial_covdata[::2]
+
+    return partial_covdata[0]
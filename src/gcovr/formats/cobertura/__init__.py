@@ -32,6 +32,7 @@ class CoberturaHandler(BaseHandler):
             "json_compare",
             # Global options used for merging.
             "merge_mode_functions",
+            "gcov_parallel",
             # Local options
             GcovrConfigOption(
                 "cobertura",
@@ -29,6 +29,7 @@ from ...data_model.coverage import (
 )
 from ...data_model.merging import MergeOptions, get_merge_mode_from_options
 from ...filter import is_file_excluded
+from ...formats.base import read_tracefiles
 from ...logging import LOGGER
 from ...options import Options
 
@@ -59,45 +60,102 @@ def read_report(options: Options) -> CoverageContainer:
             if trace_file not in datafiles:
                 datafiles.append(trace_file)
 
+    return read_tracefiles(_read_tracefiles, datafiles, options, options.gcov_parallel)
+
+
+def _read_tracefiles(datafiles: list[str], options: Options) -> CoverageContainer:
+    """Read and merge the given Cobertura files."""
+    covdata = CoverageContainer(options.root)
+    merge_options = get_merge_mode_from_options(options)
     for data_sources in datafiles:
         LOGGER.debug("Processing XML file: %s", data_sources)
 
+        source_dir = None
         try:
-            root: etree._Element = etree.parse(data_sources).getroot()  # nosec # We parse the file given by the user
-        except Exception as e:
+            # The file is parsed incrementally, each class element is processed
+            # and removed when it's complete to keep the memory usage low.
+            # The filter is already checked when the class element starts, the
+            # content of an excluded file is dropped without processing it.
+            filename = None
+            xml_element: etree._Element
+            for event, xml_element in etree.iterparse(  # nosec # We parse the file given by the user
+                data_sources, events=("start", "end"), tag=("source", "class")
+            ):
+                if xml_element.tag == "source":
+                    if (
+                        event == "end"
+                        and source_dir is None
+                        and xml_element.getparent().tag == "sources"  # type: ignore [union-attr]
+                    ):
+                        source_dir = str(xml_element.text)
+                    continue
+
+                if event == "start":
+                    if source_dir is None:
+                        raise AssertionError(
+                            f"No source directory defined in file {data_sources}"
+                        )
+                    filename = _get_filename_from_xml(
+                        data_sources, source_dir, xml_element, options
+                    )
+                    continue
+
+                if filename is not None:
+                    _insert_file_from_xml(
+                        covdata, data_sources, filename, xml_element, merge_options
+                    )
+
+                # Free the memory of the processed elements
+                xml_element.clear()
+                while xml_element.getprevious() is not None:
+                    del xml_element.getparent()[0]  # type: ignore [union-attr]
+        except (etree.LxmlError, OSError) as e:
             raise RuntimeError(f"Bad --cobertura-add-tracefile option.\n{e}") from None
 
-        source_elem = root.find("./sources/source")
-        if source_elem is None:
+        if source_dir is None:
             raise AssertionError(f"No source directory defined in file {data_sources}")
-        source_dir = str(source_elem.text)
-
-        gcovr_file: etree._Element
-        for gcovr_file in root.xpath("./packages//class"):  # type: ignore [assignment, union-attr]
-            filename = gcovr_file.get("filename")
-            if filename is None:  # pragma: no cover
-                LOGGER.warning(
-                    "Missing filename attribute in class element at %s:%s",
-                    data_sources,
-                    gcovr_file.sourceline,
-                )
-                continue
-
-            filename = str(os.path.normpath(os.path.join(source_dir, filename)))
-            if is_file_excluded(
-                "source file", filename, options.include_filter, options.exclude_filter
-            ):
-                continue
 
-            filecov = FileCoverage(data_sources, filename=filename)
-            merge_options = get_merge_mode_from_options(options)
-            xml_line: etree._Element
-            for xml_line in gcovr_file.xpath("./lines//line"):  # type: ignore [assignment, union-attr]
-                _insert_line_from_xml(filecov, data_sources, merge_options, xml_line)
+    return covdata
+
 
-            covdata.insert_file_coverage(filecov, merge_options)
+def _get_filename_from_xml(
+    data_sources: str,
+    source_dir: str,
+    xml_class: etree._Element,
+    options: Options,
+) -> str | None:
+    """Get the filename of the class element, None if the file shall be skipped."""
+    filename = xml_class.get("filename")
+    if filename is None:  # pragma: no cover
+        LOGGER.warning(
+            "Missing filename attribute in class element at %s:%s",
+            data_sources,
+            xml_class.sourceline,
+        )
+        return None
+
+    filename = str(os.path.normpath(os.path.join(source_dir, filename)))
+    if is_file_excluded(
+        "source file", filename, options.include_filter, options.exclude_filter
+    ):
+        return None
+
+    return filename
+
+
+def _insert_file_from_xml(
+    covdata: CoverageContainer,
+    data_sources: str,
+    filename: str,
+    xml_class: etree._Element,
+    merge_options: MergeOptions,
+) -> None:
+    filecov = FileCoverage(data_sources, filename=filename)
+    xml_line: etree._Element
+    for xml_line in xml_class.xpath("./lines//line"):  # type: ignore [assignment, union-attr]
+        _insert_line_from_xml(filecov, data_sources, merge_options, xml_line)
 
-    return covdata
+    covdata.insert_file_coverage(filecov, merge_options)
 
 
 def _insert_line_from_xml(
@@ -45,6 +45,7 @@ class GcovHandler(BaseHandler):
             # Global options used for merging end exclusion processing.
             "exclude_directory",
             "exclude_noncode_lines",
+            "source_analysis_cache_dir",
             "exclude_throw_branches",
             "exclude_unreachable_branches",
             "exclude_function_lines",
@@ -181,7 +182,9 @@ class GcovHandler(BaseHandler):
                 config="gcov-parallel",
                 group="gcov_options",
                 help=(
-                    "Set the number of threads to use in parallel. "
+                    "Set the number of threads to use in parallel for gcov. "
+                    "JSON, Cobertura and LCOV tracefiles and LLVM profraw files "
+                    "are read with this number of processes. "
                     "0=Number of CPUs, negative number='all but N CPUs'."
                 ),
                 nargs="?",
@@ -189,6 +192,18 @@ class GcovHandler(BaseHandler):
                 type=int,
                 default=1,
             ),
+            GcovrConfigOption(
+                "gcov_defer_exclusions",
+                ["--gcov-defer-exclusions"],
+                group="gcov_options",
+                help=(
+                    "Apply the exclusions and the decision analysis once for each "
+                    "source file after merging the data of all gcov files "
+                    "instead of applying them to the data of each gcov file. "
+                    "The source files are read after merging."
+                ),
+                action="store_true",
+            ),
         ]
 
     def validate_options(self) -> None:
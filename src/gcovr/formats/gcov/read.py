@@ -27,6 +27,7 @@ from threading import Lock
 from typing import Any, Callable
 
 from ...data_model.container import CoverageContainer
+from ...data_model.coverage import FileCoverage
 from ...data_model.merging import get_merge_mode_from_options
 from ...exceptions import SanityCheckError
 from ...decision_analysis import DecisionParser
@@ -42,6 +43,7 @@ from ...utils import (
     commonpath,
     fix_case_of_path,
     is_fs_case_insensitive,
+    read_source_file,
     search_file,
 )
 from .parser import (
@@ -109,9 +111,53 @@ def read_report(options: Options) -> CoverageContainer:
         if os.path.exists(filepath):
             os.remove(filepath)
 
+    if options.gcov_defer_exclusions:
+        for filecov in covdata.filecov(recurse=True):
+            source_lines = read_source_file(
+                options.source_encoding,
+                filecov.filename,
+                max(
+                    (
+                        linecov_collection.lineno
+                        for linecov_collection in filecov.lines()
+                    ),
+                    default=1,
+                ),
+            )
+            activate_trace_logging = not is_file_excluded(
+                "trace",
+                filecov.filename,
+                options.trace_include_filter,
+                options.trace_exclude_filter,
+            )
+            _apply_exclusions_and_decisions(
+                filecov, source_lines, options, activate_trace_logging
+            )
+
     return covdata
 
 
+def _apply_exclusions_and_decisions(
+    filecov: FileCoverage,
+    source_lines: list[str],
+    options: Options,
+    activate_trace_logging: bool,
+) -> None:
+    """Apply the exclusions and the decision analysis to the coverage of a file."""
+    if activate_trace_logging:
+        LOGGER.trace("Apply exclusions for %s", filecov.filename)
+    apply_all_exclusions(
+        filecov,
+        lines=source_lines,
+        options=get_exclusion_options_from_options(options),
+        activate_trace_logging=activate_trace_logging,
+    )
+
+    if options.show_decision:
+        decision_parser = DecisionParser(filecov, source_lines)
+        decision_parser.parse_all_lines()
+
+
 def find_existing_gcov_files(
     search_path: str, exclude_directory: list[re.Pattern[str]]
 ) -> list[str]:
@@ -222,18 +268,10 @@ def process_gcov_json_data(
             options.trace_include_filter,
             options.trace_exclude_filter,
         )
-        if activate_trace_logging:
-            LOGGER.trace("Apply exclusions for %s", filecov.filename)
-        apply_all_exclusions(
-            filecov,
-            lines=source_lines,
-            options=get_exclusion_options_from_options(options),
-            activate_trace_logging=activate_trace_logging,
-        )
-
-        if options.show_decision:
-            decision_parser = DecisionParser(filecov, source_lines)
-            decision_parser.parse_all_lines()
+        if not options.gcov_defer_exclusions:
+            _apply_exclusions_and_decisions(
+                filecov, source_lines, options, activate_trace_logging
+            )
 
         if activate_trace_logging:
             LOGGER.trace(
@@ -311,18 +349,10 @@ def process_gcov_text_data(
         use_existing_files=options.gcov_use_existing_files,
     )
 
-    if activate_trace_logging:
-        LOGGER.trace("Apply exclusions for %s", fname)
-    apply_all_exclusions(
-        filecov,
-        lines=source_lines,
-        options=get_exclusion_options_from_options(options),
-        activate_trace_logging=activate_trace_logging,
-    )
-
-    if options.show_decision:
-        decision_parser = DecisionParser(filecov, source_lines)
-        decision_parser.parse_all_lines()
+    if not options.gcov_defer_exclusions:
+        _apply_exclusions_and_decisions(
+            filecov, source_lines, options, activate_trace_logging
+        )
 
     merge_mode = get_merge_mode_from_options(options)
     if activate_trace_logging:
@@ -34,6 +34,7 @@ class JsonHandler(BaseHandler):
             "verbose",
             # Global options used for merging.
             "merge_mode_functions",
+            "gcov_parallel",
             "show_decision",
             # Local options
             GcovrConfigOption(
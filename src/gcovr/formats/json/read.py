@@ -17,19 +17,21 @@
 #
 # ****************************************************************************
 
-import gzip
 import json
 import os
 from glob import glob
+from typing import Any, Iterator
 
 from ...filter import is_file_excluded
 
 from ...data_model import version
 from ...data_model.container import CoverageContainer
+from ...data_model.coverage import FileCoverage
 from ...data_model.merging import get_merge_mode_from_options
+from ...formats.base import read_tracefiles
 from ...logging import LOGGER
 from ...options import Options
-from ...utils import GZIP_SUFFIX
+from ...utils import open_text_for_reading
 
 
 #
@@ -61,38 +63,70 @@ def read_report(options: Options) -> CoverageContainer:
                 f"but {len(datafiles)} were given."
             )
 
-        merge_options = get_merge_mode_from_options(options)
-        for data_source in datafiles:
-            activate_trace_logging = not is_file_excluded(
-                "trace",
-                data_source,
-                options.trace_include_filter,
-                options.trace_exclude_filter,
-            )
-            if activate_trace_logging:
-                LOGGER.trace("Processing file: %s", data_source)
-
-            if data_source.casefold().endswith(GZIP_SUFFIX):
-                with gzip.open(data_source, "rt", encoding="utf-8") as fh:
-                    gcovr_json_data = json.loads(fh.read())
-            else:
-                with open(data_source, encoding="utf-8") as json_file:
-                    gcovr_json_data = json.load(json_file)
-
-            format_version = str(gcovr_json_data["gcovr/format_version"])
-            if format_version != version.FORMAT_VERSION:
-                raise AssertionError(
-                    f"Wrong format version, got {format_version} expected {version.FORMAT_VERSION}."
-                )
+        covdata = read_tracefiles(
+            _read_tracefiles,
+            datafiles,
+            options,
+            # The compare mode needs the two files in the given order.
+            1 if options.json_compare else options.gcov_parallel,
+        )
+
+    return covdata
+
+
+def _read_tracefiles(datafiles: list[str], options: Options) -> CoverageContainer:
+    """Read and merge the given trace files."""
+    covdata = CoverageContainer(options.root)
+    merge_options = get_merge_mode_from_options(options)
+    for data_source in datafiles:
+        activate_trace_logging = not is_file_excluded(
+            "trace",
+            data_source,
+            options.trace_include_filter,
+            options.trace_exclude_filter,
+        )
+        if activate_trace_logging:
+            LOGGER.trace("Processing file: %s", data_source)
 
+        gcovr_files = _read_tracefile_files(data_source)
+        if merge_options.json_compare:
             covdata.merge(
                 CoverageContainer.deserialize(
-                    data_source, gcovr_json_data["files"], options, merge_options
+                    data_source, list(gcovr_files), options, merge_options
                 ),
                 merge_options,
             )
-            merge_options = get_merge_mode_from_options(
-                options, respect_json_compare=True
-            )
+        else:
+            # Merge the files directly into the result, the JSON data of each
+            # file is only decoded and kept while it is deserialized.
+            for gcovr_file in gcovr_files:
+                if (
+                    filecov := FileCoverage.deserialize(
+                        data_source, gcovr_file, merge_options, options
+                    )
+                ) is not None:
+                    covdata.insert_file_coverage(filecov, merge_options)
+        merge_options = get_merge_mode_from_options(options, respect_json_compare=True)
 
     return covdata
+
+
+def _read_tracefile_files(data_source: str) -> Iterator[dict[str, Any]]:
+    """Read the JSON tracefile and yield the entries of the files one by one.
+
+    The entries are removed from the decoded data when they are yielded, this
+    way the data of a file can be released after it's deserialized.
+    """
+    with open_text_for_reading(data_source, encoding="utf-8") as json_file:
+        gcovr_json_data = json.load(json_file)
+
+    format_version = str(gcovr_json_data["gcovr/format_version"])
+    if format_version != version.FORMAT_VERSION:
+        raise AssertionError(
+            f"Wrong format version, got {format_version} expected {version.FORMAT_VERSION}."
+        )
+
+    gcovr_files: list[dict[str, Any]] = gcovr_json_data.pop("files")
+    gcovr_files.reverse()
+    while gcovr_files:
+        yield gcovr_files.pop()
@@ -17,13 +17,19 @@
 #
 # ****************************************************************************
 
+import json
 import os
 from typing import Any
 
 from ...data_model import version
 from ...data_model.container import CoverageContainer
 from ...options import Options
-from ...utils import force_unix_separator, write_json_output
+from ...utils import (
+    PRETTY_JSON_INDENT,
+    force_unix_separator,
+    open_text_for_writing,
+    write_json_output,
+)
 
 SUMMARY_FORMAT_VERSION = (
     # BEGIN summary version
@@ -37,15 +43,40 @@ def write_report(
     covdata: CoverageContainer, output_file: str, options: Options
 ) -> None:
     """Produce an JSON report in the format partially compatible with gcov JSON output."""
-    write_json_output(
-        {
-            "gcovr/format_version": version.FORMAT_VERSION,
-            "files": covdata.serialize(options),
-        },
-        pretty=options.json_pretty,
-        filename=output_file,
-        default_filename="coverage.json",
-    )
+    # The files are serialized and written one after the other instead of dumping
+    # a dictionary with all the data. The output is the same as from json.dump.
+    if options.json_pretty:
+        newline = "\n" + " " * PRETTY_JSON_INDENT
+        newline_files = newline + " " * PRETTY_JSON_INDENT
+        separator = ","
+    else:
+        newline = newline_files = ""
+        separator = ", "
+
+    with open_text_for_writing(output_file, "coverage.json") as fh:
+        fh.write("{")
+        fh.write(newline)
+        fh.write(f'"gcovr/format_version": {json.dumps(version.FORMAT_VERSION)}')
+        fh.write(separator)
+        fh.write(newline)
+        fh.write('"files": [')
+        files_written = False
+        for data_dict in covdata.serialize(options):
+            if files_written:
+                fh.write(separator)
+            fh.write(newline_files)
+            fh.write(
+                json.dumps(
+                    data_dict,
+                    indent=PRETTY_JSON_INDENT if options.json_pretty else None,
+                ).replace("\n", newline_files)
+            )
+            files_written = True
+        if files_written:
+            fh.write(newline)
+        fh.write("]")
+        fh.write(newline[:1])
+        fh.write("}")
 
 
 def write_summary_report(
@@ -42,6 +42,10 @@ class LcovHandler(BaseHandler):
         return [
             # JSON option use for validation
             "json_compare",
+            # Global options used for merging.
+            "merge_mode_functions",
+            "gcov_parallel",
+            # Local options
             GcovrConfigOption(
                 "lcov",
                 ["--lcov"],
@@ -91,6 +95,22 @@ class LcovHandler(BaseHandler):
                 ),
                 default="GCOVR_report",
             ),
+            GcovrConfigOption(
+                "lcov_tracefile",
+                ["--lcov-add-tracefile"],
+                config="lcov-add-tracefile",
+                help=(
+                    "Combine the coverage data from LCOV info files. "
+                    "Unix style wildcards can be used to add the pathnames "
+                    "matching a specified pattern. In this case pattern "
+                    "must be set in double quotation marks. "
+                    "Option can be specified multiple times. "
+                    "When this option is used gcov is not run to collect "
+                    "the new coverage data."
+                ),
+                action="append",
+                default=[],
+            ),
         ]
 
     def validate_options(self) -> None:
@@ -98,6 +118,9 @@ class LcovHandler(BaseHandler):
         if self.options.lcov and self.options.json_compare:
             raise ValueError("A lcov report is not possible with --json-compare.")
 
+        if self.options.lcov_tracefile and self.options.json_compare:
+            raise ValueError("A lcov tracefile is not possible with --json-compare.")
+
         if (
             self.options.lcov_test_name is not None
             and " " in self.options.lcov_test_name
@@ -106,6 +129,11 @@ class LcovHandler(BaseHandler):
                 f"The LCOV test name must not contain spaces, got {self.options.lcov_test_name!r}."
             )
 
+    def read_report(self) -> CoverageContainer:
+        from .read import read_report  # pylint: disable=import-outside-toplevel # Lazy loading is intended here
+
+        return read_report(self.options)
+
     def write_report(self, covdata: CoverageContainer, output_file: str) -> None:
         from .write import write_report  # pylint: disable=import-outside-toplevel # Lazy loading is intended here
 
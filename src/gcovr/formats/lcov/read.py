@@ -0,0 +1,220 @@
+# -*- coding:utf-8 -*-
+
+#  ************************** Copyrights and license ***************************
+#
+# This file is part of gcovr 8.6+main, a parsing and reporting tool for gcov.
+# https://gcovr.com/en/main
+#
+# _____________________________________________________________________________
+#
+# Copyright (c) 2013-2026 the gcovr authors
+# Copyright (c) 2013 Sandia Corporation.
+# Under the terms of Contract DE-AC04-94AL85000 with Sandia Corporation,
+# the U.S. Government retains certain rights in this software.
+#
+# This software is distributed under the 3-clause BSD License.
+# For more information, see the README.rst file.
+#
+# ****************************************************************************
+
+"""
+Handle reading of LCOV files.
+
+The LCOV format is described in https://github.com/linux-test-project/lcov/blob/07a1127c2b4390abf4a516e9763fb28a956a9ce4/man/geninfo.1#L989
+"""
+
+# cspell:ignore FNDA BRDA FNL FNA
+
+import os
+from glob import glob
+
+from ...data_model.container import CoverageContainer
+from ...data_model.coverage import FileCoverage
+from ...data_model.merging import MergeOptions, get_merge_mode_from_options
+from ...filter import is_file_excluded
+from ...formats.base import read_tracefiles
+from ...logging import LOGGER
+from ...options import Options
+from ...utils import open_text_for_reading
+
+
+def read_report(options: Options) -> CoverageContainer:
+    """Merge the coverage from multiple reports in the LCOV info format."""
+
+    covdata = CoverageContainer(options.root)
+    if len(options.lcov_tracefile) == 0:
+        return covdata
+
+    datafiles = list[str]()
+
+    for trace_file_pattern in options.lcov_tracefile:
+        trace_files = glob(trace_file_pattern, recursive=True)
+        if not trace_files:
+            raise RuntimeError(
+                f"Bad --lcov-add-tracefile={trace_file_pattern} option.\n"
+                "\tThe specified file does not exist."
+            )
+
+        for trace_file in trace_files:
+            trace_file = os.path.normpath(trace_file)
+            if trace_file not in datafiles:
+                datafiles.append(trace_file)
+
+    return read_tracefiles(_read_tracefiles, datafiles, options, options.gcov_parallel)
+
+
+def _read_tracefiles(datafiles: list[str], options: Options) -> CoverageContainer:
+    """Read and merge the given LCOV files."""
+    covdata = CoverageContainer(options.root)
+    merge_options = get_merge_mode_from_options(options)
+    for data_source in datafiles:
+        LOGGER.debug("Processing LCOV file: %s", data_source)
+        with open_text_for_reading(data_source, encoding="utf-8") as fh:
+            record = _LcovRecord(data_source, options)
+            try:
+                for lineno, line in enumerate(fh, 1):
+                    try:
+                        end_of_record = record.parse_line(line.rstrip("\r\n"))
+                    except ValueError:
+                        raise RuntimeError(
+                            "Bad --lcov-add-tracefile option.\n"
+                            f"Invalid line in {data_source}:{lineno}: {line.rstrip()}"
+                        ) from None
+                    if end_of_record:
+                        if record.filename is None:
+                            raise RuntimeError(
+                                "Bad --lcov-add-tracefile option.\n"
+                                f"Missing SF line for record ending in {data_source}:{lineno}."
+                            )
+                        if (filecov := record.get_filecov(merge_options)) is not None:
+                            covdata.insert_file_coverage(filecov, merge_options)
+                        record = _LcovRecord(data_source, options)
+            except UnicodeDecodeError as e:
+                raise RuntimeError(
+                    "Bad --lcov-add-tracefile option.\n"
+                    f"Invalid UTF-8 in {data_source}: {e}"
+                ) from None
+            if record.filename is not None:
+                # E.g. a truncated file, the data of the record is incomplete
+                raise RuntimeError(
+                    "Bad --lcov-add-tracefile option.\n"
+                    f"Missing end_of_record for the record of {record.filename} at the end of {data_source}."
+                )
+
+    return covdata
+
+
+class _LcovRecord:
+    """Collect the data of a LCOV record (from SF to end_of_record)."""
+
+    def __init__(self, data_source: str, options: Options) -> None:
+        self.data_source = data_source
+        self.options = options
+        self.filename: str | None = None
+        self.is_excluded = False
+        self.functions = dict[str, int]()
+        self.function_counts = dict[str, int]()
+        self.function_linenos = dict[str, int]()
+        self.branches = dict[int, list[tuple[int, int, bool, int]]]()
+        self.lines = dict[int, int]()
+
+    def parse_line(self, line: str) -> bool:
+        """Parse a line of the file, return True at the end of the record."""
+        if line == "end_of_record":
+            return True
+
+        tag, _, value = line.partition(":")
+        if tag == "SF":
+            self.filename = os.path.normpath(
+                os.path.join(os.path.abspath(self.options.root), value)
+            )
+            self.is_excluded = is_file_excluded(
+                "source file",
+                self.filename,
+                self.options.include_filter,
+                self.options.exclude_filter,
+            )
+        elif self.is_excluded:
+            # Skip the data of excluded files
+            pass
+        elif tag == "DA":
+            # DA:<line number>,<execution count>[,<checksum>]
+            # The checksum is ignored because the tools use different encodings.
+            lineno, count = value.split(",", 2)[:2]
+            self.lines[int(lineno)] = int(count)
+        elif tag == "BRDA":
+            # BRDA:<line number>,[<exception>]<block>,<branch>,<taken>
+            lineno, block, branch, taken = value.split(",", 3)
+            throw = block.startswith("e")
+            branches = self.branches.setdefault(int(lineno), [])
+            branches.append(
+                (
+                    # LCOV 2.x can use an expression as branch identifier
+                    # for other tools, the position is used in this case.
+                    int(branch) if branch.isdigit() else len(branches),
+                    int(block.removeprefix("e")),
+                    throw,
+                    0 if taken == "-" else int(taken),
+                )
+            )
+        elif tag == "FN":
+            # FN:<line number of function start>,[<line number of function end>,]<function name>
+            lineno, name = value.split(",", 1)
+            end_lineno, _, name_without_end = name.partition(",")
+            if end_lineno.isdigit() and name_without_end:
+                name = name_without_end
+            self.functions[name] = int(lineno)
+        elif tag == "FNDA":
+            # FNDA:<execution count>,<function name>
+            count, name = value.split(",", 1)
+            self.function_counts[name] = self.function_counts.get(name, 0) + int(count)
+        elif tag == "FNL":
+            # FNL:<index>,<line number of function start>[,<line number of function end>]
+            index, lineno = value.split(",", 2)[:2]
+            self.function_linenos[index] = int(lineno)
+        elif tag == "FNA":
+            # FNA:<index>,<execution count>,<function name>
+            index, count, name = value.split(",", 2)
+            if index not in self.function_linenos:
+                raise ValueError(f"Unknown function index {index}.")
+            self.functions[name] = self.function_linenos[index]
+            self.function_counts[name] = self.function_counts.get(name, 0) + int(count)
+        # All other records contain summaries or information not used by gcovr.
+
+        return False
+
+    def get_filecov(self, merge_options: MergeOptions) -> FileCoverage | None:
+        """Get the file coverage of the record, None if file is excluded."""
+        if self.filename is None or self.is_excluded:
+            return None
+
+        filecov = FileCoverage(self.data_source, filename=self.filename)
+        for name, lineno in self.functions.items():
+            filecov.insert_function_coverage(
+                self.data_source,
+                merge_options,
+                mangled_name=None,
+                demangled_name=name,
+                lineno=lineno,
+                count=self.function_counts.get(name, 0),
+                blocks=None,
+            )
+        for lineno in sorted(self.lines.keys() | self.branches.keys()):
+            # Lines with branches but without line data are added with a count of 0.
+            linecov = filecov.insert_line_coverage(
+                self.data_source,
+                merge_options,
+                lineno=lineno,
+                count=self.lines.get(lineno, 0),
+                function_name=None,
+            )
+            for branchno, block, throw, taken in self.branches.get(lineno, []):
+                linecov.insert_branch_coverage(
+                    self.data_source,
+                    branchno=branchno,
+                    count=taken,
+                    throw=throw,
+                    source_block_id=block,
+                )
+
+        return filecov
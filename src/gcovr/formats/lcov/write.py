@@ -126,7 +126,9 @@ def write_report(
                     while function_linenos and linecov.lineno >= function_linenos[0]:
                         lineno = function_linenos.pop(0)
                         optional_checksum = (
-                            f",{linecov.md5}" if linecov.lineno == lineno else ""
+                            f",{linecov.md5}"
+                            if linecov.lineno == lineno and linecov.md5
+                            else ""
                         )
                         # DA:<line number>,<execution count>[,<checksum>]
                         fh.write(
@@ -136,8 +138,11 @@ def write_report(
                         continue
 
                 if linecov.is_reportable:
+                    optional_checksum = f",{linecov.md5}" if linecov.md5 else ""
                     # DA:<line number>,<execution count>[,<checksum>]
-                    fh.write(f"DA:{linecov.lineno},{linecov.count},{linecov.md5}\n")
+                    fh.write(
+                        f"DA:{linecov.lineno},{linecov.count}{optional_checksum}\n"
+                    )
 
             stats = filecov.stats
             # LH:<number of lines with a non\-zero execution count>
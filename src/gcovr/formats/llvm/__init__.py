@@ -21,7 +21,7 @@ import logging
 import os
 from ...data_model.container import CoverageContainer
 from ...formats.base import BaseHandler
-from ...options import GcovrConfigOption
+from ...options import GcovrConfigOption, relative_path
 
 LOGGER = logging.getLogger("gcovr")
 
@@ -42,6 +42,7 @@ class LlvmHandler(BaseHandler):
             # Global options used for merging end exclusion processing.
             "exclude_directory",
             "exclude_noncode_lines",
+            "source_analysis_cache_dir",
             "exclude_throw_branches",
             "exclude_unreachable_branches",
             "exclude_function_lines",
@@ -53,6 +54,7 @@ class LlvmHandler(BaseHandler):
             "exclude_pattern_prefix",
             "warn_excluded_lines_with_hits",
             "merge_mode_functions",
+            "gcov_parallel",
             # Local options
             GcovrConfigOption(
                 "llvm_profdata_cmd",
@@ -78,6 +80,40 @@ class LlvmHandler(BaseHandler):
                 type=str,
                 action="append",
             ),
+            GcovrConfigOption(
+                "llvm_profdata_merge_all",
+                ["--llvm-profdata-merge-all"],
+                group="llvm_options",
+                help=(
+                    "Merge all profraw files with a single llvm-profdata call and export "
+                    "the coverage data once instead of once for each profraw file. "
+                    "If -j is given, it sets the number of threads used by llvm-profdata."
+                ),
+                action="store_true",
+            ),
+            GcovrConfigOption(
+                "llvm_cov_ignore_filename_regex",
+                ["--llvm-cov-ignore-filename-regex"],
+                group="llvm_options",
+                help=(
+                    "Pass the exclude filters which can be expressed as regular expressions "
+                    "of llvm-cov to 'llvm-cov export' with -ignore-filename-regex. "
+                    "llvm-cov matches the paths of the coverage mapping without normalizing them "
+                    "or resolving symlinks, use this option only if these paths are real paths."
+                ),
+                action="store_true",
+            ),
+            GcovrConfigOption(
+                "llvm_cov_export_cache_dir",
+                ["--llvm-cov-export-cache-dir"],
+                group="llvm_options",
+                help=(
+                    "Cache the data exported by llvm-cov in this directory. "
+                    "The cache is keyed by the content of the profraw files and the binaries "
+                    "and the version of llvm-cov."
+                ),
+                type=relative_path,
+            ),
         ]
 
     def validate_options(self) -> None:
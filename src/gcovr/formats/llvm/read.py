@@ -32,17 +32,21 @@ The behavior of this parser was informed by the following sources:
 
 from dataclasses import dataclass
 from enum import Enum
+from functools import partial
+from hashlib import sha256
 import json
 import logging
+from multiprocessing import cpu_count
 import os
 import re
 import shlex
 import subprocess  # nosec
+import tempfile
 from typing import Any
 
 
 from ...exclusions import apply_all_exclusions, get_exclusion_options_from_options
-from ...filter import is_file_excluded
+from ...filter import AbsoluteFilter, Filter, RelativeFilter, is_file_excluded
 from ...data_model.container import CoverageContainer
 from ...data_model.coverage import FileCoverage
 from ...data_model.merging import (
@@ -51,14 +55,47 @@ from ...data_model.merging import (
     MergeOptions,
 )
 from ...decision_analysis import DecisionParser
+from ...formats.base import read_tracefiles
 from ...options import Options
-from ...utils import get_md5_hexdigest, read_source_file, search_file, write_json_output
+from ...utils import (
+    force_unix_separator,
+    get_cache_file,
+    get_md5_hexdigest,
+    limit_cache_size,
+    read_source_file,
+    search_file,
+    write_json_output,
+)
 
 LOGGER = logging.getLogger("gcovr")
 
 EXPECTED_TYPE = "llvm.coverage.json.export"
 EXPECTED_MAJOR_VERSION = 2
 
+EXPORT_CACHE_SIZE_LIMIT = 1024 * 1024 * 1024
+"""Size limit of the directory for the cached exports, the least recently used
+entries are removed at the first access in a run if the limit is exceeded."""
+
+# Python regular expression syntax which has no equivalent or a different
+# meaning in the POSIX extended regular expressions used by llvm-cov:
+# extensions like (?...), lazy and possessive quantifiers, escape sequences
+# like \d, escapes and nested brackets in bracket expressions, repetitions
+# with braces (literal in Python if not valid) and empty alternatives.
+_UNSUPPORTED_IGNORE_FILENAME_REGEX = re.compile(
+    r"\(\?|[*+?}][*+?]|\\[0-9A-Za-z]|\[[^\]]*[\\[]|[{}]|\(\)|\(\||\|\)|\|\||^\||\|$"
+)
+
+# The index of the used fields in the segments of the exported JSON data:
+# [line, column, count, has count, is region entry, is gap region]
+_SEGMENT_LINE = 0
+_SEGMENT_COUNT = 2
+# The index of the used fields in the branch regions of the exported JSON data:
+# [line start, column start, line end, column end, true execution count,
+#  false execution count, file id, expanded file id, kind]
+_BRANCH_LINE_START = 0
+_BRANCH_TRUE_EXECUTION_COUNT = 4
+_BRANCH_FALSE_EXECUTION_COUNT = 5
+
 
 #
 #  Get coverage from already existing gcovr JSON files
@@ -76,47 +113,47 @@ def read_report(options: Options) -> CoverageContainer:
             if profraw_file not in profraw_files:
                 profraw_files.append(profraw_file)
 
-    covdata = CoverageContainer(options.root)
-
-    merge_options = get_merge_mode_from_options(options)
-    for profraw_file in profraw_files:
-        activate_trace_logging = not is_file_excluded(
-            "trace",
-            profraw_file,
-            options.trace_include_filter,
-            options.trace_exclude_filter,
-        )
-        if activate_trace_logging:
-            LOGGER.trace("Processing file: %s", profraw_file)
-        llvm_json_data = _llvm_profraw_to_json(options, profraw_file)
-
-        if (current_type := llvm_json_data.get("type")) != EXPECTED_TYPE:
-            raise AssertionError(
-                f"Wrong JSON type, got {current_type} expected {EXPECTED_TYPE}."
+    if options.llvm_cov_ignore_filename_regex:
+        for regex in _get_ignore_filename_regex(options.exclude_filter):
+            LOGGER.debug("Using -ignore-filename-regex=%s for llvm-cov export.", regex)
+    # The binaries and llvm-cov don't change during a run, they are only hashed once.
+    export_tool_key = (
+        None
+        if options.llvm_cov_export_cache_dir is None
+        else _get_export_tool_key(options)
+    )
+    if options.llvm_profdata_merge_all:
+        covdata = CoverageContainer(options.root)
+        if profraw_files:
+            # Use a unique name, several runs can use the same profraw directory.
+            fd, profdata = tempfile.mkstemp(
+                prefix="gcovr-merged.",
+                suffix=".profdata",
+                dir=os.path.dirname(profraw_files[0]) or ".",
             )
-        if not (current_version := llvm_json_data.get("version", "")).startswith(
-            f"{EXPECTED_MAJOR_VERSION}."
-        ):
-            raise AssertionError(
-                f"Wrong major version, got {current_version or None} expected {EXPECTED_MAJOR_VERSION}.x.x."
+            os.close(fd)
+            LOGGER.debug(
+                "Merging %d profraw files into %s", len(profraw_files), profdata
             )
-
-        covdata.merge(
-            read_json(
-                profraw_file,
-                llvm_json_data,
-                options,
-                merge_options,
-                version=tuple(
-                    int(v) for v in llvm_json_data.get("version", "").split(".")
+            covdata = _read_llvm_json(
+                profdata,
+                _llvm_profraw_to_json(
+                    options, profraw_files, profdata, export_tool_key
                 ),
-            ),
-            merge_options,
+                options,
+                get_merge_mode_from_options(options),
+            )
+    else:
+        covdata = read_tracefiles(
+            partial(_read_profraw_files, export_tool_key=export_tool_key),
+            profraw_files,
+            options,
+            options.gcov_parallel,
         )
 
-        if options.delete_input_files:
-            for profraw_file in profraw_files:
-                os.unlink(profraw_file)
+    if options.delete_input_files:
+        for profraw_file in profraw_files:
+            os.unlink(profraw_file)
 
     for filecov in covdata.filecov(recurse=True):
         source_lines = read_source_file(
@@ -149,6 +186,63 @@ def read_report(options: Options) -> CoverageContainer:
     return covdata
 
 
+def _read_profraw_files(
+    profraw_files: list[str], options: Options, export_tool_key: str | None
+) -> CoverageContainer:
+    """Read and merge the given profraw files one by one."""
+    covdata = CoverageContainer(options.root)
+    merge_options = get_merge_mode_from_options(options)
+    for profraw_file in profraw_files:
+        activate_trace_logging = not is_file_excluded(
+            "trace",
+            profraw_file,
+            options.trace_include_filter,
+            options.trace_exclude_filter,
+        )
+        if activate_trace_logging:
+            LOGGER.trace("Processing file: %s", profraw_file)
+        profdata = os.path.splitext(profraw_file)[0] + ".profdata"
+        covdata.merge(
+            _read_llvm_json(
+                profraw_file,
+                _llvm_profraw_to_json(
+                    options, [profraw_file], profdata, export_tool_key
+                ),
+                options,
+                merge_options,
+            ),
+            merge_options,
+        )
+
+    return covdata
+
+
+def _read_llvm_json(
+    data_source: str,
+    llvm_json_data: dict[str, Any],
+    options: Options,
+    merge_options: MergeOptions,
+) -> CoverageContainer:
+    """Check the type and version of the exported JSON data and read it."""
+    if (current_type := llvm_json_data.get("type")) != EXPECTED_TYPE:
+        raise AssertionError(
+            f"Wrong JSON type, got {current_type} expected {EXPECTED_TYPE}."
+        )
+    if not (current_version := llvm_json_data.get("version", "")).startswith(
+        f"{EXPECTED_MAJOR_VERSION}."
+    ):
+        raise AssertionError(
+            f"Wrong major version, got {current_version or None} expected {EXPECTED_MAJOR_VERSION}.x.x."
+        )
+
+    return read_json(
+        data_source,
+        llvm_json_data,
+        options,
+        merge_options,
+    )
+
+
 def find_datafiles(
     search_path: str, exclude_directory: list[re.Pattern[str]]
 ) -> list[str]:
@@ -177,66 +271,172 @@ def find_datafiles(
     return files
 
 
-def _llvm_profraw_to_json(options: Options, profraw: str) -> dict[str, Any]:
-    """Transform the profraw file to to JSON and load it."""
+def _get_ignore_filename_regex(exclude_filter: tuple[Filter, ...]) -> list[str]:
+    r"""Get the regular expressions for -ignore-filename-regex of llvm-cov export.
+
+    Only the exclude filters which can be expressed exactly are used, all
+    filters are applied again when reading the exported data. The regular
+    expressions of llvm-cov aren't anchored, the ones of the filters are
+    anchored at the beginning of the path.
+
+    llvm-cov matches the paths of the coverage mapping as they are, the
+    filters match the real path. Therefore this is only used if requested
+    with --llvm-cov-ignore-filename-regex.
+
+    >>> _get_ignore_filename_regex((AbsoluteFilter("/usr/.*"), AbsoluteFilter("/opt/(?:a|b)")))
+    ['^(/usr/.*)']
+    >>> _get_ignore_filename_regex((RelativeFilter("/", r"build/.*\.h$"),))
+    ['^/(build/.*\\.h$)']
+    >>> _get_ignore_filename_regex((RelativeFilter("/", r"build/\d+/"),))
+    []
+    """
+    ignore_filename_regex = list[str]()
+    for filter_ in exclude_filter:
+        pattern = filter_.pattern.pattern
+        if _UNSUPPORTED_IGNORE_FILENAME_REGEX.search(pattern):
+            continue
+        if isinstance(filter_, AbsoluteFilter):
+            ignore_filename_regex.append(f"^({pattern})")
+        elif isinstance(filter_, RelativeFilter):
+            root = force_unix_separator(filter_.root).rstrip("/")
+            ignore_filename_regex.append(f"^{re.escape(root)}/({pattern})")
+
+    return ignore_filename_regex
+
+
+def _run_cmd(cmd: list[str], activate_trace_logging: bool) -> tuple[str, str]:
+    """Run the given command."""
     env = dict(os.environ)
     env["LC_ALL"] = "C"
     env["LANGUAGE"] = "en_US"
 
-    activate_trace_logging = not is_file_excluded(
-        "trace", profraw, options.trace_include_filter, options.trace_exclude_filter
+    tool = cmd[0]
+    if activate_trace_logging:
+        LOGGER.trace("Running %s: %s", tool, shlex.join(cmd))
+    with subprocess.Popen(  # nosec # We know that we execute llvm-profdata tool
+        cmd,
+        env=env,
+        encoding="utf-8",
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+    ) as process:
+        out, err = process.communicate()
+        if process.returncode == 0:
+            if activate_trace_logging:
+                LOGGER.trace("STDERR >>%s<< End of STDERR", err)
+                LOGGER.trace("STDOUT >>%s<< End of STDOUT", out)
+        else:
+            raise RuntimeError(
+                f"{tool} returncode was {process.returncode}{' (exited by signal)' if process.returncode < 0 else ''}.\n"
+                f"STDOUT >>{out}<< End of STDOUT\n"
+                f"STDERR >>{err}<< End of STDERR"
+            )
+        return out, err
+
+
+def _llvm_profraw_to_json(
+    options: Options,
+    profraw_files: list[str],
+    profdata: str,
+    export_tool_key: str | None,
+) -> dict[str, Any]:
+    """Merge the profraw files into the given profdata file, transform it to JSON and load it.
+
+    If the export cache is used, export_tool_key is the result of
+    _get_export_tool_key() for the options.
+    """
+    activate_trace_logging = any(
+        not is_file_excluded(
+            "trace",
+            profraw,
+            options.trace_include_filter,
+            options.trace_exclude_filter,
+        )
+        for profraw in profraw_files
     )
 
     def run_cmd(cmd: list[str]) -> tuple[str, str]:
         """Run the given command."""
-
-        tool = cmd[0]
-        if activate_trace_logging:
-            LOGGER.trace("Running %s: %s", tool, shlex.join(cmd))
-        with subprocess.Popen(  # nosec # We know that we execute llvm-profdata tool
-            cmd,
-            env=env,
-            encoding="utf-8",
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-        ) as process:
-            out, err = process.communicate()
-            if process.returncode == 0:
-                if activate_trace_logging:
-                    LOGGER.trace("STDERR >>%s<< End of STDERR", err)
-                    LOGGER.trace("STDOUT >>%s<< End of STDOUT", out)
-            else:
-                raise RuntimeError(
-                    f"{tool} returncode was {process.returncode}{' (exited by signal)' if process.returncode < 0 else ''}.\n"
-                    f"STDOUT >>{out}<< End of STDOUT\n"
-                    f"STDERR >>{err}<< End of STDERR"
-                )
-            return out, err
-
-    profdata = os.path.splitext(profraw)[0] + ".profdata"
+        return _run_cmd(cmd, activate_trace_logging)
+
+    llvm_cov_cmd = options.llvm_profdata_cmd.replace("llvm-profdata", "llvm-cov")
+    export_options = [
+        *(
+            f"-ignore-filename-regex={regex}"
+            for regex in (
+                _get_ignore_filename_regex(options.exclude_filter)
+                if options.llvm_cov_ignore_filename_regex
+                else []
+            )
+        ),
+        # Additional binaries must be given with -object, else they are used as source files
+        options.llvm_cov_binaries[0],
+        *(
+            binary if binary.startswith("-") else f"-object={binary}"
+            for binary in options.llvm_cov_binaries[1:]
+        ),
+    ]
+
+    cache_file = None
+    if options.llvm_cov_export_cache_dir is not None and export_tool_key is not None:
+        limit_cache_size(options.llvm_cov_export_cache_dir, EXPORT_CACHE_SIZE_LIMIT)
+        cache_file = get_cache_file(
+            options.llvm_cov_export_cache_dir,
+            _get_export_cache_key(
+                options,
+                profraw_files,
+                [export_tool_key, llvm_cov_cmd, *export_options],
+            ),
+        )
+        if os.path.exists(cache_file):
+            LOGGER.debug("Using cached llvm-cov export %s", cache_file)
+            with open(cache_file, encoding="utf-8") as fh_in:
+                llvm_json_data: dict[str, Any] = json.load(fh_in)
+            # Update the modification time for the eviction of the least recently used entries
+            os.utime(cache_file)
+            return llvm_json_data
+
+    # Use a file with the input files to avoid a too long command line,
+    # the weight is always given to support file names with a comma.
+    input_files = profdata + ".inputs"
     try:
+        if len(profraw_files) == 1:
+            inputs = profraw_files
+        else:
+            with open(input_files, "w", encoding="utf-8") as fh_out:
+                fh_out.writelines(f"1,{profraw}\n" for profraw in profraw_files)
+            inputs = [f"--input-files={input_files}"]
+            # Without -j llvm-profdata uses its own default number of threads.
+            if (number_of_threads := options.gcov_parallel) != 1:
+                if number_of_threads < 0:
+                    number_of_threads = max(1, cpu_count() + number_of_threads)
+                inputs.insert(0, f"--num-threads={number_of_threads}")
         run_cmd(
             [
                 options.llvm_profdata_cmd,
                 "merge",
                 "--sparse",
                 f"--output={profdata}",
-                profraw,
+                *inputs,
             ]
         )
         json_string, _ = run_cmd(
-            [
-                options.llvm_profdata_cmd.replace("llvm-profdata", "llvm-cov"),
-                "export",
-                f"--instr-profile={profdata}",
-                *options.llvm_cov_binaries,
-            ]
+            [llvm_cov_cmd, "export", f"--instr-profile={profdata}", *export_options]
         )
     finally:
-        if not options.keep_intermediate_files and os.path.exists(profdata):
-            os.remove(profdata)
-
-    llvm_json_data: dict[str, Any] = json.loads(json_string)
+        if not options.keep_intermediate_files:
+            for filename in (input_files, profdata):
+                if os.path.exists(filename):
+                    os.remove(filename)
+
+    if cache_file is not None:
+        os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+        # Write to a temporary file first, the cache may be used by parallel processes.
+        with open(f"{cache_file}.{os.getpid()}", "w", encoding="utf-8") as fh_out:
+            fh_out.write(json_string)
+        os.replace(f"{cache_file}.{os.getpid()}", cache_file)
+
+    llvm_json_data = json.loads(json_string)
     if options.keep_intermediate_files:
         write_json_output(
             llvm_json_data,
@@ -247,12 +447,50 @@ def _llvm_profraw_to_json(options: Options, profraw: str) -> dict[str, Any]:
     return llvm_json_data
 
 
+def _get_export_tool_key(options: Options) -> str:
+    """Get the part of the export cache key from the version of llvm-cov and the binaries.
+
+    This is computed once for each run, the binaries can be large.
+    """
+    # The version is part of the key, the export depends on the used tool.
+    llvm_cov_cmd = options.llvm_profdata_cmd.replace("llvm-profdata", "llvm-cov")
+    llvm_cov_version, _ = _run_cmd([llvm_cov_cmd, "--version"], False)
+    hash_ = sha256(llvm_cov_version.encode("utf-8"))
+    for filename in options.llvm_cov_binaries:
+        hash_.update(_get_file_digest(filename))
+
+    return hash_.hexdigest()
+
+
+def _get_export_cache_key(
+    options: Options, profraw_files: list[str], export_cmd: list[str]
+) -> str:
+    """Get the key of the export cache from the content of the input files and the commands."""
+    hash_ = sha256()
+    for item in (options.llvm_profdata_cmd, *export_cmd):
+        hash_.update(item.encode("utf-8"))
+        hash_.update(b"\0")
+    for filename in profraw_files:
+        hash_.update(_get_file_digest(filename))
+
+    return hash_.hexdigest()
+
+
+def _get_file_digest(filename: str) -> bytes:
+    """Get the SHA-256 digest of the content of the file."""
+    file_hash = sha256()
+    with open(filename, "rb") as fh_in:
+        while chunk := fh_in.read(1024 * 1024):
+            file_hash.update(chunk)
+
+    return file_hash.digest()
+
+
 def read_json(
     data_source: str,
     json_data: dict[str, Any],
     options: Options,
     merge_options: MergeOptions,
-    version: tuple[int, ...],
 ) -> CoverageContainer:
     """Read one clang JSON coverage report."""
     covdata = CoverageContainer(options.root)
@@ -266,7 +504,7 @@ def read_json(
                 "%s: Found 'mcdc_records' in exported JSON report. This is ignored by GCOVR.",
                 data_source,
             )
-        read_json_files(data_source, data, options, merge_options, covdata, version)
+        read_json_files(data_source, data, options, merge_options, covdata)
         read_json_functions(data_source, data, options, merge_options, covdata)
 
     for filecov in covdata.filecov(recurse=True):
@@ -293,7 +531,6 @@ def read_json_files(
     options: Options,
     merge_options: MergeOptions,
     covdata: CoverageContainer,
-    version: tuple[int, ...],
 ) -> None:
     """Read the files from clang JSON coverage report."""
     file_data: dict[str, Any]
@@ -305,21 +542,19 @@ def read_json_files(
         ):
             continue
         filecov = FileCoverage(data_source, filename=filename)
-        segments_by_line = dict[int, list[Segment]]()
-        for segment in [
-            (Segment(*[*segment, False]) if version == (2, 0, 0) else Segment(*segment))
-            for segment in file_data["segments"]
-        ]:
-            if segment.line not in segments_by_line:
-                segments_by_line[segment.line] = list[Segment]()
-            segments_by_line[segment.line].append(segment)
-
-        for lineno, segments in segments_by_line.items():
+        # Use the raw lists of the export instead of objects for each entry.
+        count_by_line = dict[int, int]()
+        for segment in file_data["segments"]:
+            lineno, count = segment[_SEGMENT_LINE], segment[_SEGMENT_COUNT]
+            if count_by_line.get(lineno, -1) < count:
+                count_by_line[lineno] = count
+
+        for lineno, count in count_by_line.items():
             filecov.insert_line_coverage(
                 data_source,
                 merge_options,
                 lineno=lineno,
-                count=max(segment.count for segment in segments),
+                count=count,
                 function_name=None,
                 block_ids=None,
                 md5=None,
@@ -327,15 +562,15 @@ def read_json_files(
             )
 
         covdata.insert_file_coverage(filecov, merge_options)
-        branches_by_line = dict[int, list[BranchRegion]]()
+        branches_by_line = dict[int, list[tuple[int, int]]]()
         branches_found |= "branches" in file_data
-        for branch_region in [
-            BranchRegion(*branch_region)
-            for branch_region in file_data.get("branches", [])
-        ]:
-            if branch_region.line_start not in branches_by_line:
-                branches_by_line[branch_region.line_start] = list[BranchRegion]()
-            branches_by_line[branch_region.line_start].append(branch_region)
+        for branch_region in file_data.get("branches", []):
+            branches_by_line.setdefault(branch_region[_BRANCH_LINE_START], []).append(
+                (
+                    branch_region[_BRANCH_TRUE_EXECUTION_COUNT],
+                    branch_region[_BRANCH_FALSE_EXECUTION_COUNT],
+                )
+            )
 
         for line, branch_regions in branches_by_line.items():
             linecov_collection = filecov.get_line(line)
@@ -356,11 +591,11 @@ def read_json_files(
                 )
             else:
                 linecov = list(linecov_collection.linecov())[0]
-            for index, branch_region in enumerate(branch_regions):
+            for index, (true_count, false_count) in enumerate(branch_regions):
                 linecov.insert_branch_coverage(
                     data_source,
                     branchno=index * 2,
-                    count=branch_region.true_execution_count,
+                    count=true_count,
                     fallthrough=False,
                     throw=False,
                     source_block_id=None,
@@ -370,7 +605,7 @@ def read_json_files(
                 linecov.insert_branch_coverage(
                     data_source,
                     branchno=(index * 2) + 1,
-                    count=branch_region.false_execution_count,
+                    count=false_count,
                     fallthrough=False,
                     throw=False,
                     source_block_id=None,
@@ -438,24 +673,6 @@ def read_json_functions(
         covdata.insert_file_coverage(filecov, merge_options)
 
 
-@dataclass
-class Segment:
-    """Representation of a segment."""
-
-    line: int
-    """The line where this segment begins."""
-    col: int
-    """The column where this segment begins."""
-    count: int
-    """The execution count, or zero if no count was recorded."""
-    has_count: bool
-    """When false, the segment was not instrumented or skipped."""
-    is_region_entry: bool
-    """Whether this enters a new region or returns to a previous count."""
-    is_gap_region: bool
-    """Whether this enters a gap region."""
-
-
 class RegionKind(Enum):
     """The region kinds as described in https://github.com/llvm/llvm-project/blob/64b98967542d0128457154080f91c1ec4283eecb/llvm/include/llvm/ProfileData/Coverage/CoverageMapping.h#L233."""
 
@@ -488,30 +705,6 @@ class RegionKind(Enum):
     """A Branch Region can be extended to include IDs to facilitate MC/DC."""
 
 
-@dataclass
-class BranchRegion:
-    """Representation of a branch region."""
-
-    line_start: int
-    """The starting line number of the region."""
-    column_start: int
-    """The starting column number of the region."""
-    line_end: int
-    """The ending line number of the region."""
-    column_end: int
-    """The ending column number of the region."""
-    true_execution_count: int
-    """Number of times the true branch was taken."""
-    false_execution_count: int
-    """Number of times the false branch was taken."""
-    file_id: int
-    """Identifier for the file containing the region."""
-    expanded_file_id: int
-    """Identifier for the expanded file, if applicable."""
-    kind: RegionKind
-    """Type of region (e.g., code, gap, etc.)."""
-
-
 @dataclass
 class FunctionRegion:
     """Representation of a function region."""
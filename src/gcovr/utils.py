@@ -21,11 +21,12 @@ import gzip
 from hashlib import md5
 import json
 import lzma
-from typing import Any, BinaryIO, Callable, Iterator, TextIO
+from typing import Any, BinaryIO, Callable, Hashable, Iterator, TextIO, TypeVar, cast
 import os
 import functools
 import re
 import sys
+import threading
 from contextlib import contextmanager
 from lxml import etree  # nosec # We only write XML files
 
@@ -37,6 +38,12 @@ PRETTY_JSON_INDENT = 4
 GZIP_SUFFIX = ".gz"
 LZMA_SUFFIX = ".xz"
 
+# The size of a cache directory is only checked at the first access in a run.
+_CACHE_DIRS_LOCK = threading.Lock()
+_CHECKED_CACHE_DIRS = set[str]()
+
+_T = TypeVar("_T")
+
 
 class LoopChecker:
     """Class for checking if a directory was already scanned."""
@@ -195,6 +202,20 @@ def commonpath(files: list[str]) -> str:
     return prefix_path
 
 
+@contextmanager
+def open_text_for_reading(filename: str, **kwargs: Any) -> Iterator[TextIO | Any]:
+    """Context manager to open and close a (compressed) file for text reading."""
+    if filename.casefold().endswith(GZIP_SUFFIX):
+        with gzip.open(filename, "rt", **kwargs) as fh_in:
+            yield fh_in
+    elif filename.casefold().endswith(LZMA_SUFFIX):
+        with lzma.open(filename, "rt", **kwargs) as fh_in:
+            yield fh_in
+    else:
+        with open(filename, "rt", **kwargs) as fh_in:  # pylint: disable=unspecified-encoding
+            yield fh_in
+
+
 @contextmanager
 def open_text_for_writing(
     filename: str | None, default_filename: str | None = None, **kwargs: Any
@@ -320,6 +341,98 @@ def get_md5_hexdigest(data: bytes) -> str:
     return md5(data, usedforsecurity=False).hexdigest()  # nosec # Not used for security
 
 
+def get_cache_file(cache_dir: str, key: str) -> str:
+    """Get the file of an entry in a cache directory, the entries are spread over subdirectories."""
+    return os.path.join(cache_dir, key[:2], f"{key}.json")
+
+
+def limit_cache_size(cache_dir: str, size_limit: int) -> None:
+    """Remove the least recently used entries if the cache is bigger than the limit, only once per run."""
+    with _CACHE_DIRS_LOCK:
+        if cache_dir in _CHECKED_CACHE_DIRS:
+            return
+        _CHECKED_CACHE_DIRS.add(cache_dir)
+
+        entries = list[tuple[float, int, str]]()
+        if os.path.isdir(cache_dir):
+            for subdir in os.scandir(cache_dir):
+                if subdir.is_dir():
+                    for entry in os.scandir(subdir.path):
+                        if entry.is_file() and entry.name.endswith(".json"):
+                            stat = entry.stat()
+                            entries.append((stat.st_mtime, stat.st_size, entry.path))
+
+        total_size = sum(size for _, size, _ in entries)
+        if total_size > size_limit:
+            LOGGER.debug(
+                "Cache %s has %d bytes, removing old entries.",
+                cache_dir,
+                total_size,
+            )
+            for _, size, path in sorted(entries):
+                if total_size <= size_limit:
+                    break
+                try:
+                    os.remove(path)
+                    total_size -= size
+                except OSError:  # pragma: no cover
+                    pass
+
+
+def clear_checked_cache_dirs() -> None:
+    """Check the size of the cache directories again, needed if gcovr is called several times in the same process."""
+    with _CACHE_DIRS_LOCK:
+        _CHECKED_CACHE_DIRS.clear()
+
+
+class SourceCache:
+    """Data derived from the lines of a source file.
+
+    The data only depends on the source code (and the given key), it's shared
+    by all the coverage data of the same source code in a run, e.g. a header
+    included in several translation units.
+    """
+
+    def __init__(self, digest: str) -> None:
+        self.digest = digest
+        self._data = dict[Hashable, Any]()
+
+    def get(self, key: Hashable, compute: Callable[[], _T]) -> _T:
+        """Get the data for the key, compute it if not available."""
+        if key not in self._data:
+            self._data[key] = compute()
+        return cast(_T, self._data[key])
+
+
+_SOURCE_CACHES_LOCK = threading.Lock()
+_SOURCE_CACHES = dict[str, SourceCache]()
+# The last source of each thread, the lines are used by several passes one after the other.
+_LAST_SOURCE = threading.local()
+
+
+def get_source_cache(lines: list[str]) -> SourceCache:
+    """Get the cache of the source lines, the digest is only computed once for the same list."""
+    last_source: tuple[list[str], SourceCache] | None = getattr(
+        _LAST_SOURCE, "value", None
+    )
+    if last_source is not None and last_source[0] is lines:
+        return last_source[1]
+
+    digest = get_md5_hexdigest("\n".join(lines).encode("utf-8", errors="surrogatepass"))
+    with _SOURCE_CACHES_LOCK:
+        if (source_cache := _SOURCE_CACHES.get(digest)) is None:
+            source_cache = _SOURCE_CACHES[digest] = SourceCache(digest)
+    _LAST_SOURCE.value = (lines, source_cache)
+    return source_cache
+
+
+def clear_source_caches() -> None:
+    """Clear the data of the source files, needed if gcovr is called several times in the same process."""
+    with _SOURCE_CACHES_LOCK:
+        _SOURCE_CACHES.clear()
+    _LAST_SOURCE.__dict__.clear()
+
+
 def read_source_file(
     source_encoding: str, filename: str, max_line_number: int
 ) -> list[str]:
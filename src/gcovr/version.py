@@ -0,0 +1,4 @@
+# -*- coding:utf-8 -*-
+# file generated by setuptools_scm
+# don't change, don't track in version control
+__version__ = '8.6.post1.dev1+g889fd14a2'
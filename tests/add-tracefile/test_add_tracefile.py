@@ -59,3 +59,34 @@ def test(gcovr_test_exec: "GcovrTestExec") -> None:
         "--json=coverage.json",
     )
     gcovr_test_exec.compare_json()
+
+    # Reading in parallel must give the same result
+    gcovr_test_exec.gcovr(
+        "-j",
+        "2",
+        "--json-add-tracefile=coverage_*.json",
+        "--json-pretty",
+        "--json=merged_parallel.json",
+    )
+    assert (gcovr_test_exec.output_dir / "merged_parallel.json").read_text(
+        encoding="utf-8"
+    ) == (gcovr_test_exec.output_dir / "coverage.json").read_text(encoding="utf-8")
+
+    # Compressed tracefiles must give the same result
+    gcovr_test_exec.gcovr(
+        "--json-add-tracefile=coverage_foo.json",
+        "--json-pretty",
+        "--json=compressed_foo.json.gz",
+    )
+    gcovr_test_exec.gcovr(
+        "--json-add-tracefile=coverage_bar.json",
+        "--json=compressed_bar.json.xz",
+    )
+    gcovr_test_exec.gcovr(
+        "--json-add-tracefile=compressed_*.json.*",
+        "--json-pretty",
+        "--json=merged_compressed.json",
+    )
+    assert (gcovr_test_exec.output_dir / "merged_compressed.json").read_text(
+        encoding="utf-8"
+    ) == (gcovr_test_exec.output_dir / "coverage.json").read_text(encoding="utf-8")
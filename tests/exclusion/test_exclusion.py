@@ -17,9 +17,12 @@
 #
 # ****************************************************************************
 
+from pathlib import Path
 import re
 import pytest
 
+from gcovr.exclusions.cache import get_source_analysis
+from gcovr.utils import clear_source_caches
 from tests.conftest import IS_DARWIN, IS_GCC, IS_LINUX, GcovrTestExec
 
 
@@ -98,6 +101,28 @@ def test_exclude_line(  # type: ignore[no-untyped-def]
     )
     gcovr_test_exec.compare_sonarqube()
 
+    for run in range(2):
+        process = gcovr_test_exec.gcovr(
+            "--warn-excluded-lines-with-hits",
+            "--source-analysis-cache-dir=cache",
+            "--json-pretty",
+            f"--json=coverage.cached{run}.json",
+        )
+        check.is_in("main.cpp:8: Line with 1 hit(s) excluded.", process.stderr)
+        gcovr_test_exec.run(
+            "diff", "-U", "1", "coverage.json", f"coverage.cached{run}.json"
+        )
+    check.is_true(any((gcovr_test_exec.output_dir / "cache").glob("*/*.json")))
+
+    process = gcovr_test_exec.gcovr(
+        "--warn-excluded-lines-with-hits",
+        "--gcov-defer-exclusions",
+        "--json-pretty",
+        "--json=coverage.deferred.json",
+    )
+    check.is_in("main.cpp:8: Line with 1 hit(s) excluded.", process.stderr)
+    gcovr_test_exec.run("diff", "-U", "1", "coverage.json", "coverage.deferred.json")
+
 
 @pytest.mark.skipif(
     not IS_LINUX,
@@ -225,6 +250,17 @@ def test_exclude_line_branch(gcovr_test_exec: "GcovrTestExec") -> None:
     )
     gcovr_test_exec.compare_json()
 
+    gcovr_test_exec.gcovr(
+        "--exclude-unreachable-branches",
+        "--gcov-defer-exclusions",
+        "--json-pretty",
+        "--json",
+        gcovr_test_exec.output_dir / "coverage.deferred.json",
+        gcovr_test_exec.output_dir,
+        cwd=cwd,
+    )
+    gcovr_test_exec.run("diff", "-U", "1", "coverage.json", "coverage.deferred.json")
+
     gcovr_test_exec.gcovr(
         "--json-add-tracefile",
         gcovr_test_exec.output_dir / "coverage.json",
@@ -935,3 +971,26 @@ def test_gcov_exclude(gcovr_test_exec: "GcovrTestExec") -> None:
         "--json=coverage.json",
     )
     gcovr_test_exec.compare_json()
+
+
+def test_source_analysis_cache_with_pattern_flags(tmp_path: Path) -> None:
+    """Test that the flags of the patterns are part of the key of the cached analysis."""
+    lines = ["FOO();", "bar();"]
+    for flags, expected in ((0, []), (re.IGNORECASE, [1])):
+        # Only use the cache directory and not the data of the run
+        clear_source_caches()
+        analysis = get_source_analysis(
+            str(tmp_path),
+            lines,
+            respect_exclusion_markers=True,
+            exclude_pattern_prefix="[GL]COVR?",
+            exclude_lines_by_pattern=[re.compile("foo", flags)],
+            exclude_branches_by_pattern=[],
+            exclude_noncode_lines=False,
+            exclude_unreachable_branches=False,
+        )
+        assert analysis.markers is not None
+        assert [
+            lineno for lineno, _, custom_match in analysis.markers.line if custom_match
+        ] == expected
+    clear_source_caches()
@@ -17,7 +17,10 @@
 #
 # ****************************************************************************
 
+import gzip
+import json
 import logging
+import re
 import typing
 
 import pytest
@@ -42,3 +45,163 @@ def test_report_name_with_spaces(
         messages[0][2]
         == "The LCOV test name must not contain spaces, got 'Name with spaces'."
     )
+
+
+def test_read_tracefile(gcovr_test_exec: "GcovrTestExec") -> None:
+    """Test reading of LCOV tracefiles."""
+    gcovr_test_exec.cxx_link(
+        "testcase",
+        gcovr_test_exec.cxx_compile("main.cpp", options=["-DFOO"]),
+        gcovr_test_exec.cxx_compile("foo.cpp"),
+        gcovr_test_exec.cxx_compile("bar.cpp"),
+    )
+    gcovr_test_exec.run("./testcase")
+    gcovr_test_exec.gcovr("--lcov", "coverage.lcov")
+    gcovr_test_exec.gcovr(
+        "--lcov-add-tracefile",
+        "coverage.lcov",
+        "--lcov",
+        "coverage_from_tracefile.lcov.gz",
+    )
+    gcovr_test_exec.gcovr(
+        "-j",
+        "2",
+        "--lcov-add-tracefile",
+        "coverage_from_tracefile.lcov.gz",
+        "--lcov-add-tracefile",
+        "coverage.lcov",
+        "--lcov",
+        "coverage_merged.lcov",
+    )
+
+    def read_lcov(filename: str) -> str:
+        """Read the LCOV file without the checksums which are not read."""
+        path = gcovr_test_exec.output_dir / filename
+        if filename.endswith(".gz"):
+            with gzip.open(path, "rt", encoding="utf-8") as fh_in:
+                content = fh_in.read()
+        else:
+            content = path.read_text(encoding="utf-8")
+        return re.sub(r"^(DA:\d+,\d+),\w+$", r"\1", content, flags=re.MULTILINE)
+
+    lcov = read_lcov("coverage.lcov")
+    assert read_lcov("coverage_from_tracefile.lcov.gz") == lcov
+    # All counts are doubled after merging the same data twice
+    assert read_lcov("coverage_merged.lcov") == re.sub(
+        r"^(DA:\d+,|FNDA:|BRDA:\d+,e?\d+,\d+,)(\d+)",
+        lambda match: f"{match.group(1)}{int(match.group(2)) * 2}",
+        lcov,
+        flags=re.MULTILINE,
+    )
+
+
+def test_read_invalid_tracefile(
+    gcovr_test_exec: "GcovrTestExec", caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test error if a LCOV tracefile contains invalid data."""
+    (gcovr_test_exec.output_dir / "invalid.lcov").write_text(
+        "TN:\nSF:main.cpp\nDA:1,invalid\nend_of_record\n", encoding="utf-8"
+    )
+    process = gcovr_test_exec.gcovr(
+        "--lcov-add-tracefile", "invalid.lcov", use_main=True
+    )
+    assert process.returncode == 64, "Read error."
+    messages = caplog.record_tuples
+    assert messages[-1][1] == logging.ERROR
+    assert "Invalid line in invalid.lcov:3: DA:1,invalid" in messages[-1][2]
+
+
+def test_read_tracefile_with_invalid_utf8(
+    gcovr_test_exec: "GcovrTestExec", caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test error if a LCOV tracefile isn't valid UTF-8."""
+    (gcovr_test_exec.output_dir / "invalid.lcov").write_bytes(
+        b"TN:\nSF:main.cpp\nFN:1,f\xff\nend_of_record\n"
+    )
+    process = gcovr_test_exec.gcovr(
+        "--lcov-add-tracefile", "invalid.lcov", use_main=True
+    )
+    assert process.returncode == 64, "Read error."
+    messages = caplog.record_tuples
+    assert messages[-1][1] == logging.ERROR
+    assert (
+        "Invalid UTF-8 in invalid.lcov: 'utf-8' codec can't decode byte 0xff"
+        in messages[-1][2]
+    )
+
+
+def test_read_truncated_tracefile(
+    gcovr_test_exec: "GcovrTestExec", caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test error if the last record of a LCOV tracefile has no end_of_record."""
+    (gcovr_test_exec.output_dir / "truncated.lcov").write_text(
+        "TN:\nSF:main.cpp\nDA:1,1\n", encoding="utf-8"
+    )
+    process = gcovr_test_exec.gcovr(
+        "--lcov-add-tracefile", "truncated.lcov", use_main=True
+    )
+    assert process.returncode == 64, "Read error."
+    messages = caplog.record_tuples
+    assert messages[-1][1] == logging.ERROR
+    assert "Missing end_of_record for the record of" in messages[-1][2]
+    assert "at the end of truncated.lcov." in messages[-1][2]
+
+
+def test_read_tracefile_format_2(gcovr_test_exec: "GcovrTestExec") -> None:
+    """Test reading of the function records and branch numbers of LCOV 2.x."""
+    (gcovr_test_exec.output_dir / "format_2.lcov").write_text(
+        "\n".join(
+            [
+                "TN:",
+                "SF:main.cpp",
+                "FNL:0,3,5",
+                "FNA:0,2,main",
+                "FNA:0,1,main_alias",
+                "DA:3,2",
+                "DA:4,2",
+                "BRDA:4,0,1,2",
+                "BRDA:4,0,0,-",
+                "BRDA:4,e1,0,1",
+                "end_of_record",
+                "",
+            ]
+        ),
+        encoding="utf-8",
+    )
+    gcovr_test_exec.gcovr(
+        "--lcov-add-tracefile", "format_2.lcov", "--json", "coverage.json"
+    )
+    data = json.loads(
+        (gcovr_test_exec.output_dir / "coverage.json").read_text(encoding="utf-8")
+    )
+    [filecov] = data["files"]
+    assert [
+        (function["demangled_name"], function["lineno"], function["execution_count"])
+        for function in filecov["functions"]
+    ] == [("main", 3, 2), ("main_alias", 3, 1)]
+    [linecov] = [line for line in filecov["lines"] if line["line_number"] == 4]
+    assert [
+        (
+            branch["branchno"],
+            branch["source_block_id"],
+            branch["throw"],
+            branch["count"],
+        )
+        for branch in linecov["branches"]
+    ] == [(0, 0, False, 0), (0, 1, True, 1), (1, 0, False, 2)]
+
+
+def test_write_lines_without_checksum(gcovr_test_exec: "GcovrTestExec") -> None:
+    """Test that no checksum is written for lines read from a tracefile."""
+    (gcovr_test_exec.output_dir / "without_checksum.lcov").write_text(
+        "TN:\nSF:main.cpp\nDA:3,2\nDA:4,0\nend_of_record\n", encoding="utf-8"
+    )
+    gcovr_test_exec.gcovr(
+        "--lcov-add-tracefile", "without_checksum.lcov", "--lcov", "coverage.lcov"
+    )
+    lines = (
+        (gcovr_test_exec.output_dir / "coverage.lcov")
+        .read_text(encoding="utf-8")
+        .splitlines()
+    )
+    assert [line for line in lines if line.startswith("DA:")] == ["DA:3,2", "DA:4,0"]
@@ -65,6 +65,14 @@ def test_different_branches(gcovr_test_exec: "GcovrTestExec") -> None:
     )
     gcovr_test_exec.compare_json()
 
+    gcovr_test_exec.gcovr(
+        "--gcov-defer-exclusions",
+        "--json-trace-data-source",
+        "--json-pretty",
+        "--json=coverage.deferred.json",
+    )
+    gcovr_test_exec.run("diff", "-U", "1", "coverage.json", "coverage.deferred.json")
+
 
 @pytest.mark.skipif(
     not IS_LINUX,
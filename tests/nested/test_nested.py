@@ -234,6 +234,49 @@ def test_standard_llvm_profdata(gcovr_test_exec: "GcovrTestExec") -> None:
         cwd=Path("subdir"),
     )
     gcovr_test_exec.compare_json()
+    gcovr_test_exec.gcovr(
+        "--llvm-cov-binary=./testcase",
+        "--llvm-profdata-merge-all",
+        "-j",
+        "2",
+        "--json-pretty",
+        "--json=../coverage.merged.json",
+        cwd=Path("subdir"),
+    )
+    gcovr_test_exec.run("diff", "-U", "1", "coverage.json", "coverage.merged.json")
+    for run in range(2):
+        gcovr_test_exec.gcovr(
+            "--llvm-cov-binary=./testcase",
+            "--llvm-cov-export-cache-dir=../cache",
+            "-j",
+            "2",
+            "--json-pretty",
+            f"--json=../coverage.cached{run}.json",
+            cwd=Path("subdir"),
+        )
+        gcovr_test_exec.run(
+            "diff", "-U", "1", "coverage.json", f"coverage.cached{run}.json"
+        )
+    assert len(list((gcovr_test_exec.output_dir / "cache").iterdir())) == 1
+    # An additional binary must not be used as source file filter
+    gcovr_test_exec.gcovr(
+        "--llvm-cov-binary=./testcase",
+        "--llvm-cov-binary=./testcase",
+        "--json-pretty",
+        "--json=../coverage.objects.json",
+        cwd=Path("subdir"),
+    )
+    gcovr_test_exec.run("diff", "-U", "1", "coverage.json", "coverage.objects.json")
+    # The exclude filters are only passed to llvm-cov if requested
+    gcovr_test_exec.gcovr(
+        "--llvm-cov-binary=./testcase",
+        "--llvm-cov-ignore-filename-regex",
+        "--exclude=.*/nonexistent/",
+        "--json-pretty",
+        "--json=../coverage.ignored.json",
+        cwd=Path("subdir"),
+    )
+    gcovr_test_exec.run("diff", "-U", "1", "coverage.json", "coverage.ignored.json")
 
 
 @pytest.mark.json
@@ -638,6 +638,58 @@ def test_html_injection_via_json(
     assert c.exitcode == 0
 
 
+def test_json_tracefile_with_files_before_version(
+    capsys: pytest.CaptureFixture[str], tmp_path: Path
+) -> None:
+    import json
+
+    tempfile = tmp_path / "files_first.json"
+    tempfile.write_text(
+        json.dumps(
+            {
+                "files": [
+                    {"file": "first", "functions": [], "lines": []},
+                    {"file": "second", "functions": [], "lines": []},
+                ],
+                "gcovr/format_version": FORMAT_VERSION,
+            },
+            indent=4,
+        ),
+        encoding="utf-8",
+    )
+
+    c = capture(capsys, ["-a", str(tempfile), "--root", str(tmp_path), "--json", "-"])
+    assert c.exitcode == 0
+    assert [data["file"] for data in json.loads(c.out)["files"]] == [
+        "first",
+        "second",
+    ]
+
+
+def test_json_tracefile_wrong_version(
+    caplog: pytest.LogCaptureFixture, tmp_path: Path
+) -> None:
+    import json
+
+    tempfile = tmp_path / "wrong_version.json"
+    tempfile.write_text(
+        json.dumps(
+            {
+                "gcovr/format_version": "0.1",
+                "files": [{"file": "first", "functions": [], "lines": []}],
+            },
+        ),
+        encoding="utf-8",
+    )
+
+    c = log_capture(caplog, ["-a", str(tempfile)])
+    assert c.exitcode != 0
+    assert any(
+        f"Wrong format version, got 0.1 expected {FORMAT_VERSION}." in message[2]
+        for message in c.record_tuples
+    )
+
+
 def test_import_valid_cobertura_file(tmp_path: Path) -> None:
     from gcovr.formats import read_reports
     from gcovr.configuration import merge_options_and_set_defaults
@@ -726,6 +778,61 @@ def test_import_valid_cobertura_file(tmp_path: Path) -> None:
             assert len(branchcov_list) == 0
 
 
+def test_import_cobertura_files_in_parallel(tmp_path: Path) -> None:
+    from gcovr.formats import read_reports
+    from gcovr.configuration import merge_options_and_set_defaults
+
+    filenames = list[str]()
+    for index in range(0, 3):
+        xml_data = f"""<?xml version='1.0' encoding='UTF-8'?>
+<coverage line-rate="1.0" branch-rate="1.0" version="gcovr 8.6">
+  <sources>
+    <source>{tmp_path}</source>
+  </sources>
+  <packages>
+    <package name="source">
+      <classes>
+        <class name="code_cpp" filename="code.cpp">
+          <lines>
+            <line number="3" hits="{index + 1}" branch="false"/>
+          </lines>
+        </class>
+        <class name="excluded_cpp" filename="excluded.cpp">
+          <lines>
+            <line number="1" hits="1" branch="false"/>
+          </lines>
+        </class>
+      </classes>
+    </package>
+  </packages>
+</coverage>
+"""
+        tempfile = tmp_path / f"cobertura_{index}.xml"
+        tempfile.write_text(xml_data, encoding="utf-8")
+        filenames.append(str(tempfile))
+
+    opts = merge_options_and_set_defaults(
+        [
+            {
+                "cobertura_tracefile": filenames,
+                "include_filter": [re.compile(".")],
+                "exclude_filter": [re.compile(".*excluded")],
+                "gcov_parallel": 2,
+                "root": str(tmp_path),
+            }
+        ]
+    )
+    opts.include_filter = tuple(opts.include_filter)
+    opts.exclude_filter = tuple(opts.exclude_filter)
+    covdata = read_reports(opts)
+    assert os.path.join(tmp_path, "excluded.cpp") not in covdata
+    cov = covdata[os.path.join(tmp_path, "code.cpp")]
+    assert isinstance(cov, FileCoverage)
+    linecovs = cov.get_line(3)
+    assert linecovs is not None
+    assert linecovs.count == 6
+
+
 def test_invalid_cobertura_file(caplog: pytest.LogCaptureFixture) -> None:
     c = log_capture(caplog, ["--cobertura-add-tracefile", "/*.FileDoesNotExist.*"])
     message = c.record_tuples[0]
@@ -790,6 +897,53 @@ def test_import_cobertura_file_with_invalid_line(
     assert c.exitcode != 0
 
 
+def test_import_cobertura_file_with_invalid_line_in_excluded_file(
+    caplog: pytest.LogCaptureFixture, tmp_path: Path
+) -> None:
+    xml_data = """<?xml version='1.0' encoding='UTF-8'?>
+<!DOCTYPE coverage SYSTEM 'http://cobertura.sourceforge.net/xml/coverage-04.dtd'>
+<coverage line-rate="0.9" branch-rate="0.75" lines-covered="9" lines-valid="10" branches-covered="3" branches-valid="4" complexity="0.0" timestamp="" version="gcovr 7.1">
+  <sources>
+    <source>.</source>
+  </sources>
+  <packages>
+    <package name="source" line-rate="0.9" branch-rate="0.75" complexity="0.0">
+      <classes>
+        <class name="code_cpp" filename="/path/to/source/code.cpp" line-rate="0.9" branch-rate="0.75" complexity="0.0">
+          <methods/>
+          <lines>
+            <line number="3" hits="3" branch="false"/>
+            <line number="NoNumber" branch="true" condition-coverage="100% (2/2)" />
+            <line number="18" hits="2" branch="false"/>
+          </lines>
+        </class>
+      </classes>
+    </package>
+  </packages>
+</coverage>
+    """
+    tempfile = tmp_path / "cobertura_invalid_line.xml"
+    with tempfile.open("w+") as fp:
+        fp.write(xml_data)
+
+    c = log_capture(
+        caplog,
+        [
+            "--cobertura-add-tracefile",
+            str(tempfile),
+            "--filter",
+            ".",
+            "--exclude",
+            ".*/code\\.cpp$",
+        ],
+    )
+    # The content of the excluded file isn't processed at all.
+    assert not any(
+        "'number' attribute is required" in message[2] for message in c.record_tuples
+    )
+    assert c.exitcode == 0
+
+
 @pytest.mark.parametrize(
     "option",
     [
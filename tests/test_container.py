@@ -0,0 +1,80 @@
+# -*- coding:utf-8 -*-
+
+#  ************************** Copyrights and license ***************************
+#
+# This file is part of gcovr 8.6+main, a parsing and reporting tool for gcov.
+# https://gcovr.com/en/main
+#
+# _____________________________________________________________________________
+#
+# Copyright (c) 2013-2026 the gcovr authors
+# Copyright (c) 2013 Sandia Corporation.
+# Under the terms of Contract DE-AC04-94AL85000 with Sandia Corporation,
+# the U.S. Government retains certain rights in this software.
+#
+# This software is distributed under the 3-clause BSD License.
+# For more information, see the README.rst file.
+#
+# ****************************************************************************
+
+# pylint: disable=missing-function-docstring,missing-module-docstring
+
+import os
+
+from gcovr.data_model.container import CoverageContainer
+from gcovr.data_model.coverage import FileCoverage
+from gcovr.data_model.merging import DEFAULT_MERGE_OPTIONS
+
+
+def _make_filecov(*path: str) -> FileCoverage:
+    return FileCoverage("test", filename=os.path.join(*path))
+
+
+def test_insert_file_coverage_not_normalized(tmp_path: str) -> None:
+    root = os.path.abspath(str(tmp_path))
+    covdata = CoverageContainer(root)
+    covdata.insert_file_coverage(
+        _make_filecov(root, "a", "..", "b", "file.c"), DEFAULT_MERGE_OPTIONS
+    )
+
+    dirname_b = os.path.join(root, "b") + os.path.sep
+    assert list(covdata.data.keys()) == [dirname_b]
+    child = covdata[dirname_b]
+    assert isinstance(child, CoverageContainer)
+    assert [filecov.filename for filecov in child.filecov()] == [
+        os.path.join(root, "a", "..", "b", "file.c")
+    ]
+
+
+def test_sorted_filecov_with_cleared_properties(tmp_path: str) -> None:
+    root = os.path.abspath(str(tmp_path))
+    covdata = CoverageContainer(root)
+    for path in (
+        ("file10.c",),
+        ("File2.c",),
+        ("sub", "file1.c"),
+        ("file1.c",),
+    ):
+        covdata.insert_file_coverage(_make_filecov(root, *path), DEFAULT_MERGE_OPTIONS)
+
+    def get_sorted_filenames(filename_uses_relative_pathname: bool) -> list[str]:
+        return [
+            os.path.relpath(filecov.filename, root)
+            for filecov in covdata.sorted_filecov(
+                "filename",
+                False,
+                "line",
+                filename_uses_relative_pathname=filename_uses_relative_pathname,
+                recurse=True,
+            )
+        ]
+
+    expected = ["file1.c", "File2.c", "file10.c", os.path.join("sub", "file1.c")]
+    assert get_sorted_filenames(True) == expected
+    # Use the cached keys of another base directory
+    assert get_sorted_filenames(False) == expected
+    # Clear the properties like it's done before each writer
+    for data in covdata.traverse():
+        data.properties.clear()
+    assert get_sorted_filenames(True) == expected
+    assert get_sorted_filenames(False) == expected
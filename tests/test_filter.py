@@ -0,0 +1,101 @@
+# -*- coding:utf-8 -*-
+
+#  ************************** Copyrights and license ***************************
+#
+# This file is part of gcovr 8.6+main, a parsing and reporting tool for gcov.
+# https://gcovr.com/en/main
+#
+# _____________________________________________________________________________
+#
+# Copyright (c) 2013-2026 the gcovr authors
+# Copyright (c) 2013 Sandia Corporation.
+# Under the terms of Contract DE-AC04-94AL85000 with Sandia Corporation,
+# the U.S. Government retains certain rights in this software.
+#
+# This software is distributed under the 3-clause BSD License.
+# For more information, see the README.rst file.
+#
+# ****************************************************************************
+
+# pylint: disable=missing-function-docstring,missing-module-docstring
+
+import logging
+import os
+from pathlib import Path
+
+import pytest
+
+from gcovr.filter import (
+    AbsoluteFilter,
+    AlwaysMatchFilter,
+    DirectoryPrefixFilter,
+    Filter,
+    RelativeFilter,
+    clear_filter_cache,
+    is_file_excluded,
+)
+from gcovr.utils import force_unix_separator
+
+
+def test_combined_filter_like_single_filters(
+    caplog: pytest.LogCaptureFixture, tmp_path: Path
+) -> None:
+    root = os.path.realpath(tmp_path)
+    root_unix = force_unix_separator(root)
+    filters: tuple[Filter, ...] = (
+        AbsoluteFilter(f"{root_unix}/src/.*\\.c$"),
+        # A backreference needs its own regular expression
+        AbsoluteFilter(f"{root_unix}/(a|b)/\\1\\.h$"),
+        RelativeFilter(root, r"build/"),
+        # Inline flags need their own regular expression
+        RelativeFilter(root, r"(?i)LIB/.*\.H$"),
+        RelativeFilter(os.path.join(root, "sub"), r"file\.c$"),
+        DirectoryPrefixFilter(os.path.join(root, "include")),
+    )
+    paths = [
+        os.path.join(root, *parts)
+        for parts in (
+            ("src", "file.c"),
+            ("src", "file.h"),
+            ("a", "a.h"),
+            ("a", "b.h"),
+            ("build", "file.c"),
+            ("lib", "file.h"),
+            ("lib", "file.c"),
+            ("sub", "file.c"),
+            ("other", "file.c"),
+            ("include", "file.h"),
+            ("include", "..", "file.h"),
+        )
+    ]
+
+    def get_decisions() -> list[tuple[bool, bool]]:
+        clear_filter_cache()
+        return [
+            (
+                is_file_excluded("source file", path, (AlwaysMatchFilter(),), filters),
+                is_file_excluded("source file", path, filters, ()),
+            )
+            for path in paths
+        ]
+
+    with caplog.at_level(logging.INFO, logger="gcovr"):
+        decisions = get_decisions()
+    with caplog.at_level(logging.DEBUG, logger="gcovr"):
+        decisions_with_debug = get_decisions()
+    clear_filter_cache()
+
+    assert decisions == decisions_with_debug
+    assert [excluded for excluded, _ in decisions] == [
+        True,
+        False,
+        True,
+        False,
+        True,
+        True,
+        False,
+        True,
+        False,
+        True,
+        False,
+    ]